@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from app.schemas.ai_schema import AIPayloadSchema, AIResponseSchema
 from app.services.ai_service import AIService
@@ -6,6 +6,12 @@ from app.services.ai_service import AIService
 router = APIRouter(prefix="/ai", tags=["AI"])
 
 
+async def get_ai_service(request: Request) -> AIService:
+    return request.app.state.ai_service
+
+
 @router.post("/chat", response_model=AIResponseSchema)
-async def chat(payload: AIPayloadSchema, ai_service: AIService = Depends()):
+async def chat(
+    payload: AIPayloadSchema, ai_service: AIService = Depends(get_ai_service)
+):
     return await ai_service.chat(payload.message)
@@ -2,7 +2,8 @@
 Financial Agent API Endpoints
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 
 from app.schemas.financial_schema import (
     FinancialAnswerTextSchema,
@@ -13,10 +14,14 @@ from app.services.financial_agent_service import FinancialAgentService
 router = APIRouter(prefix="/financial", tags=["Financial Agent"])
 
 
+async def get_financial_agent_service(request: Request) -> FinancialAgentService:
+    return request.app.state.financial_agent_service
+
+
 @router.post("/ask", response_model=FinancialAnswerTextSchema)
 async def ask_financial_question(
     payload: FinancialQuestionSchema,
-    agent_service: FinancialAgentService = Depends(),
+    agent_service: FinancialAgentService = Depends(get_financial_agent_service),
 ):
     """
     Ask a financial question in natural language.
@@ -34,6 +39,30 @@ async def ask_financial_question(
         question=payload.question,
         consumer_phone_number=payload.consumer_phone_number,
     )
-    return FinancialAnswerTextSchema(
-        answer=await agent_service.format_response_naturally(response)
+    chunks = [
+        chunk async for chunk in agent_service.format_response_naturally(response)
+    ]
+    return FinancialAnswerTextSchema(answer="".join(chunks).rstrip())
+
+
+@router.post("/ask/stream", response_class=StreamingResponse)
+async def ask_financial_question_stream(
+    payload: FinancialQuestionSchema,
+    agent_service: FinancialAgentService = Depends(get_financial_agent_service),
+):
+    """
+    Ask a financial question and stream the answer as plain text.
+
+    Same as `/ask`, but the natural language answer is sent as it is
+    generated so clients can start rendering before it is complete.
+    """
+    response = await agent_service.ask(
+        question=payload.question,
+        consumer_phone_number=payload.consumer_phone_number,
+    )
+    return StreamingResponse(
+        agent_service.format_response_naturally(response),
+        media_type="text/plain; charset=utf-8",
+        # Opt out of GZip, which would hold chunks back until its buffer fills
+        headers={"Content-Encoding": "identity"},
     )
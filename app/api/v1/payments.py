@@ -1,15 +1,116 @@
-from fastapi import APIRouter, Depends
-from fastapi_pagination import Page
-from fastapi_pagination.ext.tortoise import apaginate
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from typing import Any
 
-from app.schemas.payment_schema import PaymentSchema
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi_pagination import Page, Params, create_page
+from pydantic import TypeAdapter
+
+from app.core.cache import ResponseCache, etag_json_response
+from app.schemas.payment_schema import PaymentCursorPageSchema, PaymentSchema
 from app.services.payment_service import PaymentService
 
+# Validates a whole page of rows in a single pydantic-core call
+_PAYMENT_LIST_ADAPTER = TypeAdapter(list[PaymentSchema])
+
+# Buffered NDJSON is flushed to the client in writes of about this size
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode amounts as strings, as PaymentSchema does."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
 
+async def get_payment_service(request: Request) -> PaymentService:
+    return request.app.state.payment_service
+
+
+async def get_response_cache(request: Request) -> ResponseCache:
+    return request.app.state.response_cache
+
+
 @router.get("", response_model=Page[PaymentSchema])
 async def get_payments(
-    payment_service: PaymentService = Depends(PaymentService),
+    request: Request,
+    params: Params = Depends(),
+    payment_service: PaymentService = Depends(get_payment_service),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
-    return await apaginate(payment_service.get_payments())
+    async def render() -> bytes:
+        raw_params = params.to_raw_params()
+        payments, total = await payment_service.get_payments_page(
+            limit=raw_params.limit, offset=raw_params.offset
+        )
+        page = create_page(
+            _PAYMENT_LIST_ADAPTER.validate_python(payments), total=total, params=params
+        )
+        # Cache exactly the bytes the client receives
+        return page.model_dump_json(by_alias=True).encode()
+
+    body = await cache.get_or_render(cache.make_key("payments", request), render)
+    return etag_json_response(request, body)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_payments(
+    payment_service: PaymentService = Depends(get_payment_service),
+):
+    """
+    Stream every payment, newest first, as newline-delimited JSON.
+
+    Rows are encoded batch by batch as they are read, so the first bytes go
+    out before the whole table is read and memory use stays constant.
+    """
+
+    async def ndjson() -> AsyncIterator[bytes]:
+        buffer = bytearray()
+        async for payment in payment_service.iter_payments():
+            buffer += orjson.dumps(payment, default=_json_default)
+            buffer += b"\n"
+            if len(buffer) >= _STREAM_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/cursor", response_model=PaymentCursorPageSchema)
+async def get_payments_by_cursor(
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=100),
+    payment_service: PaymentService = Depends(get_payment_service),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    """
+    List payments newest first using keyset pagination.
+
+    Pass the returned `next_cursor` as `cursor` to fetch the next page. Each
+    page is a bounded index range scan regardless of how deep the client has
+    scrolled.
+    """
+
+    async def render() -> bytes:
+        try:
+            payments, next_cursor = await payment_service.get_payments_by_cursor(
+                cursor, limit
+            )
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        page = PaymentCursorPageSchema(items=payments, next_cursor=next_cursor)
+        return page.model_dump_json().encode()
+
+    body = await cache.get_or_render(cache.make_key("payments", request), render)
+    return etag_json_response(request, body)
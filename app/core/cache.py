@@ -0,0 +1,212 @@
+"""Redis-backed caching of response bodies and tool results, plus ETags."""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi import Request, Response, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Lets browsers and CDNs reuse a listing briefly, then revalidate via ETag
+CACHE_CONTROL = "max-age=30"
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """
+    Return a JSON body with an ETag, or 304 when the client already has it.
+
+    The tag is weak because GZipMiddleware may re-encode the body; weak
+    comparison is all If-None-Match needs.
+    """
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """
+    Cache of serialized response bodies keyed by endpoint and query string.
+
+    Fails open: with no Redis configured, or when Redis errors, reads miss
+    and writes are dropped, so requests fall through to the database.
+    """
+
+    def __init__(self, client: Redis | None, ttl: int = 60):
+        self.client = client
+        self.ttl = ttl
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether there is a Redis client to read from and write to."""
+        return self.client is not None
+
+    @staticmethod
+    def make_key(namespace: str, request: Request) -> str:
+        """Build `namespace:<sha256 of path and sorted query params>`."""
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.items()))
+        digest = hashlib.sha256(f"{request.url.path}?{query}".encode()).hexdigest()
+        return f"{namespace}:{digest}"
+
+    async def get_or_render(
+        self, key: str, render: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        Return the cached body for `key`, rendering and storing it on a miss.
+
+        Concurrent misses for the same key within this process share a
+        single `render()` call instead of each querying the database.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request doing the work was cancelled; do it ourselves
+                return await render()
+
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await render()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case nobody was waiting
+            raise
+        finally:
+            del self._inflight[key]
+
+        future.set_result(body)
+        await self.set(key, body)
+        return body
+
+    async def get(self, key: str) -> bytes | None:
+        if self.client is None:
+            return None
+        try:
+            return await self.client.get(key)
+        except RedisError as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        if self.client is None:
+            return
+        try:
+            await self.client.set(key, value, ex=ttl or self.ttl)
+        except RedisError as e:
+            logger.warning("Response cache write failed: %s", e)
+
+    async def delete_pattern(self, pattern: str) -> None:
+        """Drop every cached entry matching a glob, e.g. `payments:*`."""
+        if self.client is None:
+            return
+        try:
+            keys = [key async for key in self.client.scan_iter(match=pattern)]
+            if keys:
+                await self.client.unlink(*keys)
+        except RedisError as e:
+            logger.warning("Response cache invalidation failed: %s", e)
+
+
+def _encode_value(obj: Any) -> Any:
+    """Tag the types query results use so `_decode_value` can restore them."""
+    if isinstance(obj, Decimal):
+        return {"__decimal__": str(obj)}
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if "__decimal__" in value:
+                return Decimal(value["__decimal__"])
+            if "__datetime__" in value:
+                return datetime.fromisoformat(value["__datetime__"])
+        return {key: _decode_value(item) for key, item in value.items()}
+    return value
+
+
+def cached(prefix: str, expire: int | None = None):
+    """
+    Cache an async method's result in its owner's `cache` ResponseCache.
+
+    The key is `prefix:<method name>:<sha256 of the bound arguments>`, with
+    defaults applied, so positional and keyword calls share entries.
+    Decimal and datetime values survive the round trip through Redis.
+    Methods on an object whose `cache` is None or disabled run uncached,
+    without building a key.
+
+    Args:
+        prefix: Key namespace, used to invalidate with `delete_pattern`
+        expire: TTL in seconds (the cache's own TTL when None)
+
+    Examples:
+        >>> @cached(prefix="fin", expire=300)
+        ... async def get_spending_summary(self, period="this_month"): ...
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            cache: ResponseCache | None = getattr(self, "cache", None)
+            if cache is None or not cache.enabled:
+                return await fn(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments["self"]
+            digest = hashlib.sha256(
+                orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+            key = f"{prefix}:{fn.__name__}:{digest}"
+
+            hit = await cache.get(key)
+            if hit is not None:
+                return _decode_value(orjson.loads(hit))
+
+            result = await fn(self, *args, **kwargs)
+            body = orjson.dumps(
+                result,
+                default=_encode_value,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+            await cache.set(key, body, ttl=expire)
+            return result
+
+        return wrapper
+
+    return decorator
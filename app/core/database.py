@@ -1,7 +1,28 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from tortoise import Tortoise
+
 from app.core.settings import settings
 
 TORTOISE_ORM = {
-    "connections": {"default": settings.database_url},
+    "connections": {
+        "default": {
+            "engine": "tortoise.backends.asyncpg",
+            "credentials": {
+                "host": settings.db_host,
+                "port": settings.db_port,
+                "user": settings.db_user,
+                "password": settings.db_password,
+                "database": settings.db_name,
+                # Keep a warm asyncpg pool instead of connecting per query
+                "minsize": settings.db_pool_min_size,
+                "maxsize": settings.db_pool_max_size,
+                "max_inactive_connection_lifetime": 300,
+                "statement_cache_size": 1024,
+            },
+        }
+    },
     "apps": {
         "models": {
             "models": ["app.models.payment"],
@@ -9,3 +30,18 @@ TORTOISE_ORM = {
         }
     },
 }
+
+
+@asynccontextmanager
+async def db_lifecycle() -> AsyncIterator[None]:
+    """
+    Open the database for a standalone script and close it on exit.
+
+    The app itself uses RegisterTortoise in its lifespan; this is the
+    equivalent for the scripts run with `uv run python <script>.py`.
+    """
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
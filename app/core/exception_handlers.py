@@ -4,7 +4,7 @@ import logging
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.exceptions import AIServiceException
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 async def ai_service_exception_handler(
     request: Request, exc: AIServiceException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle custom AI service exceptions.
 
@@ -23,10 +23,12 @@ async def ai_service_exception_handler(
         exc: The AI service exception
 
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
     logger.error(
-        f"AI Service Exception: {exc.error_code} - {exc.message}",
+        "AI Service Exception: %s - %s",
+        exc.error_code,
+        exc.message,
         extra={
             "path": request.url.path,
             "method": request.method,
@@ -35,7 +37,7 @@ async def ai_service_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -49,7 +51,7 @@ async def ai_service_exception_handler(
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle request validation errors.
 
@@ -58,21 +60,24 @@ async def validation_exception_handler(
         exc: The validation error
 
     Returns:
-        JSONResponse with validation error details
+        ORJSONResponse with validation error details
     """
+    errors = exc.errors()
     logger.warning(
-        f"Validation error on {request.method} {request.url.path}",
-        extra={"errors": exc.errors()},
+        "Validation error on %s %s",
+        request.method,
+        request.url.path,
+        extra={"errors": errors},
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
                 "code": "validation_error",
                 "message": "Request validation failed",
                 "status": 422,
-                "details": exc.errors(),
+                "details": errors,
             }
         },
     )
@@ -80,7 +85,7 @@ async def validation_exception_handler(
 
 async def http_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle HTTP exceptions.
 
@@ -89,10 +94,12 @@ async def http_exception_handler(
         exc: The HTTP exception
 
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
     logger.error(
-        f"HTTP Exception: {exc.status_code} - {exc.detail}",
+        "HTTP Exception: %s - %s",
+        exc.status_code,
+        exc.detail,
         extra={
             "path": request.url.path,
             "method": request.method,
@@ -100,7 +107,7 @@ async def http_exception_handler(
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -112,7 +119,7 @@ async def http_exception_handler(
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handle unexpected exceptions.
 
@@ -121,18 +128,19 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc: The exception
 
     Returns:
-        JSONResponse with generic error message
+        ORJSONResponse with generic error message
     """
     logger.error(
-        f"Unhandled exception: {str(exc)}",
-        exc_info=True,
+        "Unhandled exception: %r",
+        exc,
+        exc_info=exc,
         extra={
             "path": request.url.path,
             "method": request.method,
         },
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -0,0 +1,82 @@
+"""Queue-based logging so log I/O never runs on the event loop thread."""
+
+import io
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that only flushes once the log queue has been drained.
+
+    During a burst, records accumulate in the stream's buffer and reach
+    stderr in large writes; when traffic is quiet, each record is flushed
+    as soon as it is written.
+    """
+
+    def __init__(self, stream: io.TextIOBase, log_queue: queue.Queue):
+        super().__init__(stream)
+        self._log_queue = log_queue
+
+    def flush(self) -> None:
+        if self._log_queue.empty():
+            super().flush()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves all formatting to the listener thread.
+
+    The stock prepare() renders the message and traceback on the emitting
+    thread so records can be pickled across processes. This queue never
+    leaves the process, so the record, exc_info included, is handed over
+    as-is and the traceback is formatted off the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_queue_logging(level: int | str = logging.INFO) -> QueueListener:
+    """
+    Route root logger records through a queue drained by a background thread.
+
+    Args:
+        level: Root logger level, e.g. "INFO"; without one the root logger
+            stays at WARNING and drops the app's INFO records
+
+    Returns:
+        The started QueueListener; pass it to `stop_queue_logging` on shutdown
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream = io.TextIOWrapper(sys.stderr.buffer, write_through=False)
+    handler = _BatchingStreamHandler(stream, log_queue)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener) -> None:
+    """Flush pending records and detach the queue handler from the root logger."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+
+    listener.stop()
+
+    for handler in listener.handlers:
+        handler.flush()
+        # Detach so the wrapper never closes the real stderr buffer
+        handler.stream.detach()
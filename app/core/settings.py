@@ -1,3 +1,6 @@
+from functools import cached_property
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,13 +10,47 @@ class Settings(BaseSettings):
     db_host: str
     db_port: int = 5432
     db_name: str
+    # asyncpg pool: warm connections kept open, and the most it may grow to
+    db_pool_min_size: int = 5
+    db_pool_max_size: int = 25
+
+    # Root logger level (DEBUG, INFO, WARNING, ...)
+    log_level: str = "INFO"
 
     # deepseek
     deepseek_api_key: str
     deepseek_api_base_url: str = "https://api.deepseek.com"
     deepseek_model: str = "deepseek-chat"
+    # Per-request timeout in seconds, just above typical completion latency;
+    # timed-out, 429 and 5xx requests are retried by the client
+    llm_request_timeout: float = 15.0
+    llm_max_retries: int = 2
+    # Reformat answers with the AI even when no tool data needs presenting
+    always_reformat: bool = False
+
+    # redis; response caching is disabled when unset
+    redis_url: str | None = None
+    # Seconds; kept short so an unreachable redis falls back to uncached reads
+    redis_socket_timeout: float = 0.5
+    payments_cache_ttl: int = 60
+    # Most pool connections the payments routes may hold at once; must stay
+    # below db_pool_max_size to leave room for the AI and financial routes
+    payments_max_db_connections: int = 10
+    # Aggregates returned by the financial tools
+    financial_cache_ttl: int = 300
+    # Formatted answers are reused for identical tool results
+    format_cache_ttl: int = 86400
+
+    @model_validator(mode="after")
+    def _check_payments_share_of_pool(self) -> "Settings":
+        if not 1 <= self.payments_max_db_connections < self.db_pool_max_size:
+            raise ValueError(
+                "payments_max_db_connections must be at least 1 and below "
+                f"db_pool_max_size ({self.db_pool_max_size})"
+            )
+        return self
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         return f"asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
@@ -0,0 +1,24 @@
+from enum import Enum
+from typing import Any
+
+from tortoise.fields.data import CharEnumFieldInstance
+
+
+class FastCharEnumField(CharEnumFieldInstance):
+    """
+    CharEnumField that resolves database values through a prebuilt
+    value -> member map instead of calling the enum class for every row.
+    """
+
+    def __init__(self, enum_type: type[Enum], **kwargs: Any) -> None:
+        super().__init__(enum_type, **kwargs)
+        self._member_map = {member.value: member for member in enum_type}
+
+    def to_python_value(self, value: str | None) -> Enum | None:
+        if value is None:
+            return None
+        member = self._member_map.get(value)
+        if member is None:
+            # Unknown value: let the enum raise its usual ValueError
+            return self.enum_type(value)
+        return member
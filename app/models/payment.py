@@ -2,6 +2,7 @@ from tortoise import Model, fields
 from tortoise.contrib.pydantic import pydantic_model_creator
 
 from app.models.enums.payments import CountryCode, PaymentDirection
+from app.models.fields import FastCharEnumField
 
 
 class EndUserPayment(Model):
@@ -14,12 +15,12 @@ class EndUserPayment(Model):
     transaction_id = fields.CharField(max_length=255)
     name = fields.CharField(max_length=255, null=True, index=True)
     is_business = fields.BooleanField(default=False)
-    direction = fields.CharEnumField(
+    direction = FastCharEnumField(
         PaymentDirection, max_length=10
     )  # outgoing or incoming
     amount = fields.DecimalField(max_digits=10, decimal_places=2)
     sender_id = fields.CharField(max_length=50, index=True)  # MPESA, AIRTELMONEY etc
-    country_code = fields.CharEnumField(
+    country_code = FastCharEnumField(
         CountryCode, max_length=2, default=CountryCode.KE
     )  # ISO Alpha-2 country code i.e KE, NG, CI, GH
     consumer_phone_number = fields.CharField(max_length=15, index=True)
@@ -30,6 +31,14 @@ class EndUserPayment(Model):
     class Meta:
         table = "end_user_payments"
         unique_together = ["consumer_phone_number", "transaction_id"]
+        # Match the (phone, direction, ...) filter shape used by the repository;
+        # (direction, paid_at) serves the same aggregates without a phone filter
+        indexes = [
+            ("consumer_phone_number", "direction", "paid_at"),
+            ("consumer_phone_number", "direction", "name"),
+            ("direction", "paid_at"),
+            ("paid_at", "id"),
+        ]
 
 
 EndUserPaymentSchema = pydantic_model_creator(EndUserPayment)
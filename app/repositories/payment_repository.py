@@ -1,16 +1,147 @@
 from datetime import datetime
 from decimal import Decimal
 
-from tortoise.functions import Count, Sum
+from tortoise import connections
+from tortoise.functions import Avg, Count, Sum
 from tortoise.queryset import QuerySet
 
 from app.models.payment import EndUserPayment
 
+# Columns returned by the read-only payment listing (matches PaymentSchema)
+PAYMENT_LIST_FIELDS = (
+    "id",
+    "consumer_uid",
+    "transaction_id",
+    "name",
+    "is_business",
+    "direction",
+    "amount",
+    "sender_id",
+    "country_code",
+    "consumer_phone_number",
+    "paid_at",
+    "created_at",
+    "updated_at",
+)
+
+# Same order as the cursor listing, so it is served by the (paid_at, id) index
+_PAYMENT_PAGE_SQL = f"""
+    SELECT {", ".join(PAYMENT_LIST_FIELDS)}
+    FROM end_user_payments
+    ORDER BY paid_at DESC, id DESC
+    LIMIT $1 OFFSET $2
+"""
+
+# Keyset pages for the cursor listing and the full-listing stream. Each case has its
+# own statement so its WHERE is an index range on (paid_at, id) instead of an
+# OR that makes Postgres scan past every row before the position. NULL
+# paid_at sorts first in descending order, so the NULL rows form the head.
+_PAYMENT_COLUMNS = ", ".join(PAYMENT_LIST_FIELDS)
+_PAYMENT_KEYSET_ORDER = "ORDER BY paid_at DESC, id DESC"
+
+_PAYMENT_BATCH_FIRST_SQL = f"""
+    SELECT {_PAYMENT_COLUMNS}
+    FROM end_user_payments
+    {_PAYMENT_KEYSET_ORDER}
+    LIMIT $1
+"""
+
+_PAYMENT_BATCH_AFTER_DATED_SQL = f"""
+    SELECT {_PAYMENT_COLUMNS}
+    FROM end_user_payments
+    WHERE (paid_at, id) < ($1, $2)
+    {_PAYMENT_KEYSET_ORDER}
+    LIMIT $3
+"""
+
+_PAYMENT_BATCH_AFTER_UNDATED_SQL = f"""
+    SELECT {_PAYMENT_COLUMNS}
+    FROM end_user_payments
+    WHERE paid_at IS NULL AND id < $1
+    ORDER BY id DESC
+    LIMIT $2
+"""
+
+# The newest dated payments, read once the NULL head is exhausted
+_PAYMENT_BATCH_FIRST_DATED_SQL = f"""
+    SELECT {_PAYMENT_COLUMNS}
+    FROM end_user_payments
+    WHERE paid_at IS NOT NULL
+    {_PAYMENT_KEYSET_ORDER}
+    LIMIT $1
+"""
+
+# TO_CHAR formats for each trend granularity
+TREND_DATE_FORMATS = {
+    "day": "YYYY-MM-DD",
+    "week": "IYYY-IW",  # ISO year and week
+    "month": "YYYY-MM",
+}
+
 
 class PaymentRepository:
     def get_all_payments(self) -> QuerySet[EndUserPayment]:
         return EndUserPayment.all()
 
+    async def get_all_payments_dicts(self, limit: int, offset: int) -> list[dict]:
+        """
+        Get a page of payments, newest first, as plain dicts.
+
+        Runs one raw query on the pool, so rows skip Model instantiation and
+        per-field ORM conversion; enum columns come back as plain strings.
+
+        Args:
+            limit: Maximum results
+            offset: Number of rows to skip
+
+        Returns:
+            List of dicts keyed by PAYMENT_LIST_FIELDS
+        """
+        conn = connections.get("default")
+        return await conn.execute_query_dict(_PAYMENT_PAGE_SQL, [limit, offset])
+
+    async def get_payments_before(
+        self,
+        paid_at: datetime | None,
+        payment_id: int | None,
+        limit: int,
+    ) -> list[dict]:
+        """
+        Get a page of payments ordered by (paid_at, id) descending, starting
+        strictly after the given keyset position, as plain dicts.
+
+        Postgres sorts NULL paid_at first in descending order, so payments
+        without a paid_at are returned before all dated payments. Each query
+        is a bounded index range scan on (paid_at, id) however deep the
+        position, and holds a pool connection only while it is fetched.
+
+        Args:
+            paid_at: paid_at of the last payment on the previous page
+            payment_id: id of the last payment on the previous page
+                (None to start from the first page)
+            limit: Maximum results
+
+        Returns:
+            List of dicts keyed by PAYMENT_LIST_FIELDS
+        """
+        conn = connections.get("default")
+        if payment_id is None:
+            return await conn.execute_query_dict(_PAYMENT_BATCH_FIRST_SQL, [limit])
+        if paid_at is not None:
+            return await conn.execute_query_dict(
+                _PAYMENT_BATCH_AFTER_DATED_SQL, [paid_at, payment_id, limit]
+            )
+
+        # Finish the undated head, then continue into the dated payments
+        payments = await conn.execute_query_dict(
+            _PAYMENT_BATCH_AFTER_UNDATED_SQL, [payment_id, limit]
+        )
+        if len(payments) < limit:
+            payments += await conn.execute_query_dict(
+                _PAYMENT_BATCH_FIRST_DATED_SQL, [limit - len(payments)]
+            )
+        return payments
+
     async def get_total_by_period(
         self,
         start_date: datetime | None,
@@ -30,57 +161,66 @@ class PaymentRepository:
         Returns:
             Dict with "total" (Decimal) and "count" (int)
         """
-        query = EndUserPayment.all()
-
-        # Apply date filters
-        if start_date:
-            query = query.filter(paid_at__gte=start_date)
-        if end_date:
-            query = query.filter(paid_at__lte=end_date)
-
-        # Apply direction filter
-        if direction != "all":
-            query = query.filter(direction=direction)
-
-        # Apply user filter
-        if consumer_phone_number:
-            query = query.filter(consumer_phone_number=consumer_phone_number)
+        # A plain scalar aggregate: always exactly one row, no GROUP BY
+        sql = """
+            SELECT
+                COALESCE(SUM(amount), 0.00) as total,
+                COUNT(*) as count
+            FROM end_user_payments
+            WHERE ($1::timestamptz IS NULL OR paid_at >= $1)
+                AND ($2::timestamptz IS NULL OR paid_at <= $2)
+                AND ($3::text = 'all' OR direction = $3)
+                AND ($4::text IS NULL OR consumer_phone_number = $4)
+        """
 
-        # Aggregate
-        result = await query.annotate(total=Sum("amount"), count=Count("id")).values(
-            "total", "count"
+        conn = connections.get("default")
+        result = await conn.execute_query_dict(
+            sql, [start_date, end_date, direction, consumer_phone_number or None]
         )
 
-        if result:
-            return {
-                "total": result[0]["total"] or Decimal("0.00"),
-                "count": result[0]["count"] or 0,
-            }
-        return {"total": Decimal("0.00"), "count": 0}
+        return {"total": result[0]["total"], "count": result[0]["count"]}
 
     async def get_payments_by_name_fuzzy(
         self,
         name: str,
         limit: int,
         consumer_phone_number: str | None = None,
-    ) -> list[EndUserPayment]:
+    ) -> list[dict]:
         """
         Get payments matching a recipient name (case-insensitive fuzzy match).
 
+        Only the columns the recipient tool reports are selected, and rows
+        come back as dicts without Model instantiation.
+
         Args:
             name: Name to search for
             limit: Maximum results
             consumer_phone_number: Optional phone number filter
 
         Returns:
-            List of EndUserPayment objects
+            List of dicts with name, amount, date (paid_at, falling back to
+            created_at), direction and transaction_id
+        """
+        # Match `name` literally, as Tortoise's icontains did
+        pattern = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        sql = """
+            SELECT
+                name,
+                amount,
+                COALESCE(paid_at, created_at) as date,
+                direction,
+                transaction_id
+            FROM end_user_payments
+            WHERE name ILIKE $1
+                AND ($2::text IS NULL OR consumer_phone_number = $2)
+            ORDER BY paid_at DESC
+            LIMIT $3
         """
-        query = EndUserPayment.filter(name__icontains=name)
-
-        if consumer_phone_number:
-            query = query.filter(consumer_phone_number=consumer_phone_number)
 
-        return await query.order_by("-paid_at").limit(limit).all()
+        conn = connections.get("default")
+        return await conn.execute_query_dict(
+            sql, [f"%{pattern}%", consumer_phone_number or None, limit]
+        )
 
     async def get_top_recipients_aggregated(
         self,
@@ -121,19 +261,12 @@ class PaymentRepository:
         # Group by name and aggregate
         results = (
             await query.group_by("name")
-            .annotate(total=Sum("amount"), count=Count("id"))
+            .annotate(total=Sum("amount"), count=Count("id"), average=Avg("amount"))
             .order_by("-total")
             .limit(limit)
-            .values("name", "total", "count")
+            .values("name", "total", "count", "average")
         )
 
-        # Calculate averages
-        for result in results:
-            if result["count"] > 0:
-                result["average"] = result["total"] / result["count"]
-            else:
-                result["average"] = Decimal("0.00")
-
         return results
 
     async def get_spending_by_sender(
@@ -141,6 +274,7 @@ class PaymentRepository:
         start_date: datetime | None,
         end_date: datetime | None,
         consumer_phone_number: str | None = None,
+        include_percentage: bool = True,
     ) -> list[dict]:
         """
         Get spending grouped by sender_id (payment method).
@@ -149,27 +283,122 @@ class PaymentRepository:
             start_date: Period start (None for all time)
             end_date: Period end (None for all time)
             consumer_phone_number: Optional phone number filter
+            include_percentage: Add each sender's share of total spending
 
         Returns:
-            List of dicts with sender_id, total, count
+            List of dicts with sender_id, total, count and, if requested,
+            percentage (float, 0.0 when total spending is zero)
+        """
+        # Window over the grouped rows, so the grand total costs no extra scan
+        percentage = (
+            """,
+                COALESCE(
+                    100.0 * SUM(amount) / NULLIF(SUM(SUM(amount)) OVER (), 0), 0
+                )::float8 as percentage"""
+            if include_percentage
+            else ""
+        )
+        sql = f"""
+            SELECT
+                sender_id,
+                SUM(amount) as total,
+                COUNT(*) as count{percentage}
+            FROM end_user_payments
+            WHERE direction = 'outgoing'
+                AND ($1::timestamptz IS NULL OR paid_at >= $1)
+                AND ($2::timestamptz IS NULL OR paid_at <= $2)
+                AND ($3::text IS NULL OR consumer_phone_number = $3)
+            GROUP BY sender_id
+            ORDER BY total DESC
         """
-        query = EndUserPayment.filter(direction="outgoing")
 
-        if start_date:
-            query = query.filter(paid_at__gte=start_date)
-        if end_date:
-            query = query.filter(paid_at__lte=end_date)
-        if consumer_phone_number:
-            query = query.filter(consumer_phone_number=consumer_phone_number)
+        conn = connections.get("default")
+        return await conn.execute_query_dict(
+            sql, [start_date, end_date, consumer_phone_number or None]
+        )
 
-        results = (
-            await query.group_by("sender_id")
-            .annotate(total=Sum("amount"), count=Count("id"))
-            .order_by("-total")
-            .values("sender_id", "total", "count")
+    async def get_financial_summary(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        consumer_phone_number: str | None = None,
+        limit: int = 5,
+    ) -> dict:
+        """
+        Get the spending total, top recipients and per-sender breakdown for
+        outgoing payments in a single table scan.
+
+        Args:
+            start_date: Period start (None for all time)
+            end_date: Period end (None for all time)
+            consumer_phone_number: Optional phone number filter
+            limit: Maximum number of top recipients
+
+        Returns:
+            Dict with:
+                - total: Total amount (Decimal)
+                - count: Number of payments (int)
+                - top_recipients: List of dicts with name, total, count, average
+                - by_sender: List of dicts with sender_id, total, count
+        """
+        # GROUPING(name, sender_id) identifies the grouping set of each row:
+        # 3 = grand total, 1 = per name, 2 = per sender_id
+        sql = """
+            WITH filtered AS (
+                SELECT name, sender_id, amount
+                FROM end_user_payments
+                WHERE direction = 'outgoing'
+                    AND ($1::timestamptz IS NULL OR paid_at >= $1)
+                    AND ($2::timestamptz IS NULL OR paid_at <= $2)
+                    AND ($3::text IS NULL OR consumer_phone_number = $3)
+            )
+            SELECT
+                GROUPING(name, sender_id) as grouping_set,
+                name,
+                sender_id,
+                COALESCE(SUM(amount), 0.00) as total,
+                COUNT(*) as count,
+                AVG(amount) as average
+            FROM filtered
+            GROUP BY GROUPING SETS ((), (name), (sender_id))
+            ORDER BY total DESC
+        """
+
+        conn = connections.get("default")
+        rows = await conn.execute_query_dict(
+            sql, [start_date, end_date, consumer_phone_number or None]
         )
 
-        return results
+        summary = {
+            "total": Decimal("0.00"),
+            "count": 0,
+            "top_recipients": [],
+            "by_sender": [],
+        }
+        for row in rows:
+            if row["grouping_set"] == 3:
+                summary["total"] = row["total"]
+                summary["count"] = row["count"]
+            elif row["grouping_set"] == 1:
+                if row["name"] is not None and len(summary["top_recipients"]) < limit:
+                    summary["top_recipients"].append(
+                        {
+                            "name": row["name"],
+                            "total": row["total"],
+                            "count": row["count"],
+                            "average": row["average"],
+                        }
+                    )
+            else:
+                summary["by_sender"].append(
+                    {
+                        "sender_id": row["sender_id"],
+                        "total": row["total"],
+                        "count": row["count"],
+                    }
+                )
+
+        return summary
 
     async def get_trend_data(
         self,
@@ -187,44 +416,40 @@ class PaymentRepository:
 
         Returns:
             List of dicts with period, total, count, average
+
+        Raises:
+            ValueError: If granularity is not recognized
         """
         # This is a simplified implementation
         # For production, you'd want to use database-specific date functions
         # via raw SQL for better performance
 
-        from tortoise import connections
-
-        # Build the SQL query based on granularity
-        date_format_map = {
-            "day": "YYYY-MM-DD",
-            "week": "IYYY-IW",  # ISO year and week
-            "month": "YYYY-MM",
-        }
-
-        date_format = date_format_map.get(granularity, "YYYY-MM")
-
-        # Build WHERE clause
-        where_clauses = ["direction = 'outgoing'"]
-        if consumer_phone_number:
-            where_clauses.append(f"consumer_phone_number = '{consumer_phone_number}'")
-
-        where_sql = " AND ".join(where_clauses)
+        date_format = TREND_DATE_FORMATS.get(granularity)
+        if date_format is None:
+            raise ValueError(
+                f"Unknown granularity: {granularity}. Valid options: day, week, month"
+            )
 
-        sql = f"""
-            SELECT 
-                TO_CHAR(paid_at, '{date_format}') as period,
+        # All inputs are bound as parameters so asyncpg can reuse a single
+        # prepared statement regardless of the phone number being queried
+        sql = """
+            SELECT
+                TO_CHAR(paid_at, $1) as period,
                 SUM(amount) as total,
                 COUNT(*) as count,
                 AVG(amount) as average
             FROM end_user_payments
-            WHERE {where_sql}
-            GROUP BY TO_CHAR(paid_at, '{date_format}')
+            WHERE direction = 'outgoing'
+                AND ($2::text IS NULL OR consumer_phone_number = $2)
+            GROUP BY 1
             ORDER BY period DESC
-            LIMIT {limit}
+            LIMIT $3
         """
 
         conn = connections.get("default")
-        results = await conn.execute_query_dict(sql)
+        results = await conn.execute_query_dict(
+            sql, [date_format, consumer_phone_number or None, limit]
+        )
 
         # Convert to proper types
         for result in results:
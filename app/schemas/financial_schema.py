@@ -4,7 +4,7 @@ Schemas for Financial Agent API
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 
 
 class FinancialQuestionSchema(BaseModel):
@@ -30,6 +30,8 @@ class ToolCall(BaseModel):
         default=None, description="Result returned by the tool"
     )
 
+    model_config = ConfigDict(extra="forbid")
+
 
 class FinancialAnswerSchema(BaseModel):
     """Response schema for financial questions."""
@@ -53,3 +55,7 @@ class FinancialAnswerTextSchema(BaseModel):
     answer: str = Field(
         ..., description="Natural language answer to the user's question"
     )
+
+
+class FormattedAnswersSchema(RootModel[list[str]]):
+    """AI reply to a batched formatting prompt: one text per response."""
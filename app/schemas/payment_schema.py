@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -13,7 +14,7 @@ class PaymentSchema(BaseModel):
     name: Optional[str] = None
     is_business: bool
     direction: PaymentDirection
-    amount: float
+    amount: Decimal
     sender_id: str
     country_code: CountryCode
     consumer_phone_number: str
@@ -22,3 +23,8 @@ class PaymentSchema(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PaymentCursorPageSchema(BaseModel):
+    items: list[PaymentSchema]
+    next_cursor: Optional[str] = None
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from openai import (
@@ -20,20 +21,44 @@ from app.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
-deepseek_client = AsyncOpenAI(
-    api_key=settings.deepseek_api_key,
-    base_url=settings.deepseek_api_base_url,
-)
+# Micro-batching: chat requests arriving within WINDOW_MS of each other are
+# coalesced and dispatched together, up to MAX_BATCH requests per batch.
+MAX_BATCH = 8
+WINDOW_MS = 10
+
+# Provider status codes with a dedicated application exception
+STATUS_EXCEPTIONS: dict[int, type[AIServiceException]] = {
+    401: InvalidAPIKeyException,  # Invalid API key
+    402: InsufficientBalanceException,  # Insufficient balance
+    429: RateLimitException,  # Rate limit exceeded
+}
+
+
+def _fail_pending(batch: list[tuple[str, asyncio.Future]]) -> None:
+    """Fail callers whose requests will never be sent because of shutdown."""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(
+                AIServiceUnavailableException("AI service is shutting down.")
+            )
 
 
 class AIService:
-    def __init__(self):
-        self.client = deepseek_client
+    def __init__(self, client: AsyncOpenAI):
+        self.client = client
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._batcher: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+        self._closed = False
 
     async def chat(self, message: str) -> dict:
         """
         Send a chat message to the AI service.
 
+        The message is queued and sent along with any other messages that
+        arrive within the batching window (see `_run_batcher`). The batcher
+        is started on first use.
+
         Args:
             message: The user's message
 
@@ -44,10 +69,100 @@ class AIService:
             InsufficientBalanceException: When API account has insufficient balance
             RateLimitException: When rate limit is exceeded
             InvalidAPIKeyException: When API key is invalid
-            AIServiceUnavailableException: When service is unavailable
+            AIServiceUnavailableException: When service is unavailable, or
+                was shut down with `aclose`
             AITimeoutException: When request times out
             AIServiceException: For other AI service errors
         """
+        return await self._submit(message)
+
+    def start(self) -> None:
+        """
+        Start the batcher if it is not already running.
+
+        Raises:
+            AIServiceUnavailableException: If the service has been closed
+        """
+        if self._closed:
+            raise AIServiceUnavailableException("AI service is shutting down.")
+        if self._batcher is None or self._batcher.done():
+            self._batcher = asyncio.create_task(self._run_batcher())
+
+    async def aclose(self) -> None:
+        """
+        Stop the batcher and cancel batches still in flight.
+
+        Callers still waiting on a reply, queued or mid-batch, get an
+        AIServiceUnavailableException instead of waiting forever.
+        """
+        self._closed = True
+        tasks = [*self._batches, *([self._batcher] if self._batcher else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        _fail_pending(queued)
+
+    async def _submit(self, message: str) -> dict:
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+        return await future
+
+    async def _run_batcher(self) -> None:
+        """
+        Coalesce queued chat requests into batches and dispatch them.
+
+        Runs until `aclose`. Each batch is dispatched as its own task so a
+        slow completion never holds up collection of the next batch.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + WINDOW_MS / 1000
+
+            try:
+                while len(batch) < MAX_BATCH:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed mid-window; these requests were never dispatched
+                _fail_pending(batch)
+                raise
+
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        logger.info("Dispatching batch of %d chat request(s)", len(batch))
+        try:
+            results = await asyncio.gather(
+                *[self._complete(message) for message, _ in batch],
+                return_exceptions=True,
+            )
+        except asyncio.CancelledError:
+            _fail_pending(batch)
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # The caller went away (e.g. client disconnected)
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _complete(self, message: str) -> dict:
         try:
             logger.info("Sending chat request to AI service")
             response = await self.client.chat.completions.create(
@@ -60,48 +175,44 @@ class AIService:
         except APIStatusError as e:
             # Handle specific HTTP status errors from OpenAI
             logger.error(
-                f"OpenAI API status error: {e.status_code} - {e.message}", exc_info=True
+                "OpenAI API status error: %s - %s",
+                e.status_code,
+                e.message,
+                exc_info=True,
             )
 
-            if e.status_code == 402:
-                # Insufficient balance
-                raise InsufficientBalanceException()
-            elif e.status_code == 401:
-                # Invalid API key
-                raise InvalidAPIKeyException()
-            elif e.status_code == 429:
-                # Rate limit exceeded
-                raise RateLimitException()
-            elif e.status_code >= 500:
+            exception_class = STATUS_EXCEPTIONS.get(e.status_code)
+            if exception_class:
+                raise exception_class()
+            if e.status_code >= 500:
                 # Server errors
                 raise AIServiceUnavailableException(
                     f"AI service is experiencing issues (Status: {e.status_code})"
                 )
-            else:
-                # Other status errors
-                raise AIServiceException(
-                    message=f"AI service error: {e.message}",
-                    status_code=e.status_code,
-                    error_code="api_error",
-                )
+            # Other status errors
+            raise AIServiceException(
+                message=f"AI service error: {e.message}",
+                status_code=e.status_code,
+                error_code="api_error",
+            )
 
         except RateLimitError as e:
-            logger.error(f"OpenAI rate limit error: {e}", exc_info=True)
+            logger.error("OpenAI rate limit error: %s", e, exc_info=True)
             raise RateLimitException()
 
         except APITimeoutError as e:
-            logger.error(f"OpenAI timeout error: {e}", exc_info=True)
+            logger.error("OpenAI timeout error: %s", e, exc_info=True)
             raise AITimeoutException()
 
         except APIConnectionError as e:
-            logger.error(f"OpenAI connection error: {e}", exc_info=True)
+            logger.error("OpenAI connection error: %s", e, exc_info=True)
             raise AIServiceUnavailableException(
                 "Unable to connect to AI service. Please check your internet connection."
             )
 
         except Exception as e:
             # Catch-all for unexpected errors
-            logger.error(f"Unexpected error in AI service: {e}", exc_info=True)
+            logger.error("Unexpected error in AI service: %s", e, exc_info=True)
             raise AIServiceException(
                 message="An unexpected error occurred while processing your request.",
                 status_code=500,
@@ -5,93 +5,166 @@ This service orchestrates the AI model and financial tools to answer
 natural language questions about payment data.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
+from collections.abc import AsyncIterator
+from decimal import Decimal
 from typing import Any
 
-from fastapi import Depends
+import orjson
 from openai import AsyncOpenAI
 
+from app.core.cache import ResponseCache
 from app.core.settings import settings
-from app.schemas.financial_schema import FinancialAnswerSchema, ToolCall
-from app.services.financial_tools import FinancialTools
+from app.schemas.financial_schema import (
+    FinancialAnswerSchema,
+    FormattedAnswersSchema,
+)
+from app.services.financial_tools import FinancialTools, request_date_ranges
+from app.services.json_stream import ToolCallStreamParser, parse_fuzzy_json
 
 logger = logging.getLogger(__name__)
 
-# System prompt that describes available tools
-SYSTEM_PROMPT = """You are a financial assistant that helps users understand their payment data.
-
-You have access to the following tools to query payment information:
-
-1. get_spending_summary(period, direction)
-   - Get total spending for a time period
-   - period: "this_month", "last_month", "this_year", "last_year", "all_time"
-   - direction: "outgoing" (default), "incoming", "all"
-   - Use for: "How much did I spend this month?", "What's my total income?"
-
-2. get_payments_by_recipient(name, limit)
-   - Get payments to/from a specific recipient
-   - name: recipient name (fuzzy matching)
-   - limit: max results (default 10)
-   - Use for: "How much have I paid to Safaricom?", "Show me payments to John"
-
-3. get_top_recipients(direction, limit, period)
-   - Get top recipients by total amount
-   - direction: "outgoing" (default), "incoming", "all"
-   - limit: number of results (default 5)
-   - period: time period (default "all_time")
-   - Use for: "Who are my top 5 expenses?", "What are my biggest costs?"
-
-4. get_spending_by_category(period)
-   - Get spending grouped by payment method
-   - period: time period (default "this_month")
-   - Use for: "Break down my spending by payment method", "How much did I spend via MPESA?"
-
-5. get_payment_trends(granularity, limit)
-   - Get spending trends over time
-   - granularity: "day", "week", "month" (default)
-   - limit: number of periods (default 12)
-   - Use for: "Show me my spending trends", "What's my monthly spending pattern?"
-
-INSTRUCTIONS:
-1. Analyze the user's question carefully
-2. Select the most appropriate tool(s) to answer it
-3. Call the tool(s) with correct parameters
-4. Provide a clear, natural language answer based on the results
-
-RESPONSE FORMAT:
-You must respond with valid JSON in this exact format:
-{
-  "tool_calls": [
-    {"tool": "tool_name", "params": {"param1": "value1", "param2": "value2"}}
-  ],
-  "answer": "Natural language answer here",
-  "confidence": "high|medium|low"
-}
-
-IMPORTANT:
-- Always return valid JSON
-- Include at least one tool call
-- Make the answer conversational and helpful
-- If the question is ambiguous, ask for clarification in the answer
-- Set confidence to "high" if you're certain, "medium" if somewhat uncertain, "low" if very uncertain
+# Longest list of tool result entries included in the formatting prompt
+PROMPT_MAX_ITEMS = 20
+
+# System prompt that describes available tools. Keep it byte-identical across
+# requests (no per-user or per-date interpolation) so DeepSeek's prefix cache
+# serves it instead of re-running prefill on every question.
+SYSTEM_PROMPT = """You are a financial assistant for the user's payment data.
+
+TOOLS (defaults in brackets)
+PERIOD = this_month|last_month|this_year|last_year|all_time
+DIRECTION = outgoing|incoming|all
+- get_spending_summary(period: PERIOD [this_month], direction: DIRECTION [outgoing]): total and count
+- get_payments_by_recipient(name: fuzzy match, limit: 1-100 [10]): payments to/from a recipient
+- get_top_recipients(direction: DIRECTION [outgoing], limit: 1-20 [5], period: PERIOD [all_time]): biggest recipients by total
+- get_spending_by_category(period: PERIOD [this_month]): spending by payment method (MPESA etc.)
+- get_financial_overview(period: PERIOD [this_month], limit: 1-20 [5]): outgoing total, top recipients and payment method breakdown together; use instead of the three separate tools when a question needs all of them
+- get_payment_trends(granularity: day|week|month [month], limit: 1-365 [12]): spending over time
+
+Pick the tool(s) and params that answer the question. Reply in JSON, "tool_calls" first:
+{"tool_calls": [{"tool": "tool_name", "params": {"param1": "value1"}}], "answer": "Natural language answer here", "confidence": "high|medium|low"}
+
+RULES: at least one tool call; conversational answer; ask for clarification in the answer if the question is ambiguous; confidence reflects how certain you are.
 """
 
 
+# System message for the formatting calls
+FORMATTER_SYSTEM_PROMPT = "You are a helpful financial assistant that presents financial data in clear, natural language."
+
+# How the formatted text should read, shared by single and batched prompts
+FORMATTING_GUIDELINES = """1. Write in a friendly, professional tone
+2. Use complete sentences and paragraphs
+3. Include specific numbers and details from the tool results
+4. Don't use JSON format or technical jargon
+5. Don't mention "tools" or "parameters" - just present the information naturally
+6. If there are multiple pieces of information, organize them logically
+7. Round large numbers appropriately (e.g., "22.9 million KES" instead of "22,916,692.00 KES")
+8. Use bullet points or numbered lists if it makes the information clearer
+9. End with a helpful summary or insight if appropriate"""
+
+
+def _cancel(tasks: list[asyncio.Task]) -> None:
+    """Cancel tool tasks whose results will never be used."""
+    for task in tasks:
+        task.cancel()
+
+
+def _default(obj: Any) -> Any:
+    """Convert the non-JSON types tools return for orjson."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Dump a tool result for the formatting prompt."""
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2).decode()
+
+
+def _truncate_for_prompt(result: Any) -> Any:
+    """
+    Cap long lists in a tool result before it goes into the formatting prompt.
+
+    Tool lists are already sorted with the most relevant entries first
+    (largest totals, most recent periods), so the head is kept and the rest
+    is replaced by a count.
+    """
+    if isinstance(result, list) and len(result) > PROMPT_MAX_ITEMS:
+        omitted = len(result) - PROMPT_MAX_ITEMS
+        return result[:PROMPT_MAX_ITEMS] + [
+            {"_truncated": omitted, "note": "additional entries omitted for brevity"}
+        ]
+    if isinstance(result, dict):
+        return {key: _truncate_for_prompt(value) for key, value in result.items()}
+    return result
+
+
+def _describe_response(response: FinancialAnswerSchema) -> str:
+    """Lay out an agent response as the structured data in a formatting prompt."""
+    tool_summary = [
+        f"Tool {i}: {tool_call.tool}\n"
+        f"Parameters: {_dumps_indented(tool_call.params)}\n"
+        f"Result: {_dumps_indented(_truncate_for_prompt(tool_call.result))}"
+        for i, tool_call in enumerate(response.tool_calls, 1)
+    ]
+    tools_text = "\n\n".join(tool_summary) if tool_summary else "No tools were used."
+
+    return f"""ORIGINAL ANSWER:
+{response.answer}
+
+CONFIDENCE LEVEL:
+{response.confidence}
+
+TOOL CALLS AND RESULTS:
+{tools_text}"""
+
+
+def _formatting_fallback(response: FinancialAnswerSchema) -> str:
+    """Text sent when the AI could not format a response."""
+    return f"{response.answer}\n\n(Note: Enhanced formatting unavailable)"
+
+
+def _log_prompt_cache_usage(usage: Any) -> None:
+    """Log how much of the prompt DeepSeek served from its prefix cache."""
+    logger.info(
+        "Prompt tokens: %s (cache hit: %s, cache miss: %s)",
+        usage.prompt_tokens,
+        getattr(usage, "prompt_cache_hit_tokens", None),
+        getattr(usage, "prompt_cache_miss_tokens", None),
+    )
+
+
 class FinancialAgentService:
     """
     Service that uses AI to answer financial questions by calling appropriate tools.
     """
 
+    # FinancialTools methods the AI is allowed to call
+    TOOL_NAMES = frozenset(
+        {
+            "get_spending_summary",
+            "get_payments_by_recipient",
+            "get_top_recipients",
+            "get_spending_by_category",
+            "get_financial_overview",
+            "get_payment_trends",
+        }
+    )
+
     def __init__(
         self,
-        financial_tools: FinancialTools = Depends(),
+        financial_tools: FinancialTools,
+        client: AsyncOpenAI,
+        cache: ResponseCache | None = None,
     ):
         self.financial_tools = financial_tools
-        self.client = AsyncOpenAI(
-            api_key=settings.deepseek_api_key,
-            base_url=settings.deepseek_api_base_url,
-        )
+        # Shared application client, so keep-alive connections are reused
+        self.client = client
+        # Formatted answers, reused when the same tool results come back
+        self.cache = cache
 
     async def ask(
         self, question: str, consumer_phone_number: str | None = None
@@ -113,25 +186,62 @@ class FinancialAgentService:
             f"Financial question: {question} (consumer_phone_number={consumer_phone_number})"
         )
 
-        # Step 1: Get AI to select tools and parameters
+        # Step 1: Stream the AI's tool selection, starting each tool as soon as
+        # its call object is complete so tool I/O overlaps the rest of the reply
+        tool_specs: list[tuple[str, dict[str, Any]]] = []
+        tasks: list[asyncio.Task] = []
+        streamed: list[dict[str, Any]] = []  # Calls dispatched mid-stream
+        # Tools started below inherit this, so they share one set of date ranges
+        date_ranges_token = request_date_ranges.set({})
+
+        def dispatch(tool_call_spec: dict[str, Any]) -> None:
+            tool_name = tool_call_spec.get("tool")
+            params = dict(tool_call_spec.get("params") or {})
+
+            # Add consumer_phone_number to params if provided
+            if consumer_phone_number:
+                params["consumer_phone_number"] = consumer_phone_number
+
+            logger.info("Executing tool: %s with params: %s", tool_name, params)
+            tool_specs.append((tool_name, params))
+            tasks.append(asyncio.create_task(self._execute_tool(tool_name, params)))
+
         try:
-            response = await self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model=settings.deepseek_model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": question},
                 ],
                 temperature=0.1,  # Low temperature for more consistent tool selection
+                # JSON mode: no prose or code fences around the reply
+                response_format={"type": "json_object"},
+                stream=True,
+                # Final chunk carries usage, including DeepSeek's cache counters
+                stream_options={"include_usage": True},
             )
 
-            ai_response = response.choices[0].message.content
-            logger.info(f"AI response: {ai_response}")
+            parser = ToolCallStreamParser()
+            async for chunk in stream:
+                if chunk.usage:
+                    _log_prompt_cache_usage(chunk.usage)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    for tool_call_spec in parser.feed(delta):
+                        streamed.append(tool_call_spec)
+                        dispatch(tool_call_spec)
+
+            ai_response = parser.text
+            logger.info("AI response: %s", ai_response)
 
             # Parse AI response as JSON
             try:
-                parsed_response = json.loads(ai_response)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI response as JSON: {e}")
+                parsed_response = parse_fuzzy_json(ai_response)
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to parse AI response as JSON: %s", e)
+                _cancel(tasks)
                 # Fallback response
                 return FinancialAnswerSchema(
                     answer="I'm sorry, I couldn't process your question. Could you rephrase it?",
@@ -139,185 +249,344 @@ class FinancialAgentService:
                     confidence="low",
                 )
 
-            # Step 2: Execute tool calls
-            tool_calls = []
+            # Run any calls from the full reply that the stream scan missed
+            not_yet_matched = list(streamed)
             for tool_call_spec in parsed_response.get("tool_calls", []):
-                tool_name = tool_call_spec.get("tool")
-                params = tool_call_spec.get("params", {})
-
-                # Add consumer_phone_number to params if provided
-                if consumer_phone_number:
-                    params["consumer_phone_number"] = consumer_phone_number
-
-                logger.info(f"Executing tool: {tool_name} with params: {params}")
-
-                try:
-                    result = await self._execute_tool(tool_name, params)
-                    tool_calls.append(
-                        ToolCall(tool=tool_name, params=params, result=result)
-                    )
-                except Exception as e:
-                    logger.error(f"Tool execution failed: {e}", exc_info=True)
-                    tool_calls.append(
-                        ToolCall(
-                            tool=tool_name,
-                            params=params,
-                            result={"error": str(e)},
-                        )
-                    )
+                if tool_call_spec in not_yet_matched:
+                    not_yet_matched.remove(tool_call_spec)
+                else:
+                    dispatch(tool_call_spec)
+
+            # Step 2: Collect tool results; the calls are independent, so
+            # they run concurrently and one failure doesn't cancel the rest
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            tool_calls = []
+            for (tool_name, params), result in zip(tool_specs, results):
+                if isinstance(result, Exception):
+                    logger.error("Tool execution failed: %s", result, exc_info=result)
+                    result = {"error": str(result)}
+                tool_calls.append(
+                    {"tool": tool_name, "params": params, "result": result}
+                )
 
-            # Step 3: Return response
-            return FinancialAnswerSchema(
-                answer=parsed_response.get("answer", "I couldn't generate an answer."),
-                tool_calls=tool_calls,
-                confidence=parsed_response.get("confidence", "medium"),
+            # Step 3: Return response, validated in a single pydantic-core call
+            # rather than constructing each ToolCall separately
+            return FinancialAnswerSchema.model_validate(
+                {
+                    "answer": parsed_response.get(
+                        "answer", "I couldn't generate an answer."
+                    ),
+                    "tool_calls": tool_calls,
+                    "confidence": parsed_response.get("confidence", "medium"),
+                }
             )
 
         except Exception as e:
             logger.error(f"Financial agent failed: {e}", exc_info=True)
+            _cancel(tasks)
             return FinancialAnswerSchema(
                 answer=f"I encountered an error: {str(e)}",
                 tool_calls=[],
                 confidence="low",
             )
 
-    async def format_response_naturally(self, response: FinancialAnswerSchema) -> str:
+        finally:
+            request_date_ranges.reset(date_ranges_token)
+
+    async def format_response_naturally(
+        self, response: FinancialAnswerSchema
+    ) -> AsyncIterator[str]:
         """
         Use AI to convert a FinancialAnswerSchema into natural, conversational English.
 
         This method takes the structured response (with tool calls and results)
         and asks the AI to rewrite it as natural, human-friendly text without
-        any JSON or technical formatting.
+        any JSON or technical formatting. When a cache is configured, the
+        text written for identical tool results is reused instead.
 
         Args:
             response: The FinancialAnswerSchema object to format
 
-        Returns:
-            Natural language text formatted by the AI
+        Yields:
+            Pieces of the natural language text as the AI generates them
 
         Examples:
             >>> response = await agent.ask("How much did I spend this month?")
-            >>> natural_text = await agent.format_response_naturally(response)
-            >>> print(natural_text)
+            >>> async for text in agent.format_response_naturally(response):
+            ...     print(text, end="")
 
             You spent 45,000 KES this month across 23 transactions. This includes
             payments to various recipients, with your largest expense being...
         """
-        # Build a summary of tool calls and results for the AI
-        tool_summary = []
-        for i, tool_call in enumerate(response.tool_calls, 1):
-            tool_info = f"Tool {i}: {tool_call.tool}\n"
-            tool_info += f"Parameters: {json.dumps(tool_call.params, indent=2)}\n"
-            tool_info += f"Result: {json.dumps(self._serialize_result(tool_call.result), indent=2)}"
-            tool_summary.append(tool_info)
-
-        tools_text = (
-            "\n\n".join(tool_summary) if tool_summary else "No tools were used."
-        )
+        shortcut = self._format_without_ai(response)
+        if shortcut is not None:
+            yield shortcut
+            return
+
+        cache = self._format_cache
+        if cache is not None:
+            cache_key = self._format_cache_key(response)
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                yield cached.decode()
+                return
 
         # Create a prompt for the AI to format naturally
         formatting_prompt = f"""You are a helpful financial assistant. I have some financial data that needs to be presented to a user in a natural, conversational way.
 
 Here is the structured data:
 
-ORIGINAL ANSWER:
-{response.answer}
-
-CONFIDENCE LEVEL:
-{response.confidence}
-
-TOOL CALLS AND RESULTS:
-{tools_text}
+{_describe_response(response)}
 
 Please rewrite this information as natural, conversational English text. Follow these guidelines:
 
-1. Write in a friendly, professional tone
-2. Use complete sentences and paragraphs
-3. Include specific numbers and details from the tool results
-4. Don't use JSON format or technical jargon
-5. Don't mention "tools" or "parameters" - just present the information naturally
-6. If there are multiple pieces of information, organize them logically
-7. Round large numbers appropriately (e.g., "22.9 million KES" instead of "22,916,692.00 KES")
-8. Use bullet points or numbered lists if it makes the information clearer
-9. End with a helpful summary or insight if appropriate
+{FORMATTING_GUIDELINES}
 
 Write ONLY the natural language response, nothing else."""
 
+        started = False
+        parts: list[str] = []
         try:
             # Call AI to format naturally
             ai_response = await self.client.chat.completions.create(
                 model=settings.deepseek_model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful financial assistant that presents financial data in clear, natural language.",
-                    },
+                    {"role": "system", "content": FORMATTER_SYSTEM_PROMPT},
                     {"role": "user", "content": formatting_prompt},
                 ],
                 temperature=0.7,  # Higher temperature for more natural language
+                stream=True,
             )
 
-            natural_text = ai_response.choices[0].message.content.strip()
+            async for chunk in ai_response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not started and delta:
+                    # Match the old .strip() on the leading edge
+                    delta = delta.lstrip()
+                if delta:
+                    started = True
+                    parts.append(delta)
+                    yield delta
+
             logger.info("Successfully formatted response naturally using AI")
-            return natural_text
+            if cache is not None and parts:
+                await cache.set(
+                    cache_key, "".join(parts).encode(), ttl=settings.format_cache_ttl
+                )
 
         except Exception as e:
             logger.error(f"Failed to format response naturally: {e}", exc_info=True)
-            # Fallback to the original answer if AI formatting fails
-            return f"{response.answer}\n\n(Note: Enhanced formatting unavailable)"
-
-    async def _execute_tool(self, tool_name: str, params: dict[str, Any]) -> Any:
+            # Fallback to the original answer if AI formatting fails before
+            # anything was sent; a partial reply is left as it is
+            if not started:
+                yield _formatting_fallback(response)
+
+    async def format_responses_naturally(
+        self, batch: list[FinancialAnswerSchema]
+    ) -> list[str]:
         """
-        Execute a tool by name with given parameters.
+        Format several responses with at most one AI call.
+
+        Responses that need no AI (see `format_response_naturally`) or are
+        already cached are answered directly; the rest share a single
+        prompt that asks for a JSON array with one text per response.
 
         Args:
-            tool_name: Name of the tool to execute
-            params: Parameters to pass to the tool
+            batch: The FinancialAnswerSchema objects to format
 
         Returns:
-            Tool result
+            The natural language text for each response, in the same order
 
-        Raises:
-            ValueError: If tool name is unknown
+        Examples:
+            >>> texts = await agent.format_responses_naturally([r1, r2, r3])
+            >>> len(texts)
+            3
         """
-        tool_map = {
-            "get_spending_summary": self.financial_tools.get_spending_summary,
-            "get_payments_by_recipient": self.financial_tools.get_payments_by_recipient,
-            "get_top_recipients": self.financial_tools.get_top_recipients,
-            "get_spending_by_category": self.financial_tools.get_spending_by_category,
-            "get_payment_trends": self.financial_tools.get_payment_trends,
-        }
+        texts = [self._format_without_ai(response) for response in batch]
+        cache = self._format_cache
+        if cache is not None:
+            cache_keys = [self._format_cache_key(response) for response in batch]
+            missing = [i for i, text in enumerate(texts) if text is None]
+            cached = await asyncio.gather(*(cache.get(cache_keys[i]) for i in missing))
+            for i, value in zip(missing, cached):
+                if value is not None:
+                    texts[i] = value.decode()
+
+        pending = [i for i, text in enumerate(texts) if text is None]
+        if not pending:
+            return texts
+
+        sections = "\n\n".join(
+            f"RESPONSE {n}:\n{_describe_response(batch[i])}"
+            for n, i in enumerate(pending, 1)
+        )
+        formatting_prompt = f"""You are a helpful financial assistant. I have {len(pending)} pieces of financial data that each need to be presented to a user in a natural, conversational way.
 
-        tool = tool_map.get(tool_name)
-        if not tool:
-            raise ValueError(f"Unknown tool: {tool_name}")
+Here is the structured data:
+
+{sections}
+
+Please rewrite each response as natural, conversational English text. Follow these guidelines:
+
+{FORMATTING_GUIDELINES}
+
+Reply with ONLY a JSON array of {len(pending)} strings, one per response and in the same order."""
+
+        try:
+            ai_response = await self.client.chat.completions.create(
+                model=settings.deepseek_model,
+                messages=[
+                    {"role": "system", "content": FORMATTER_SYSTEM_PROMPT},
+                    {"role": "user", "content": formatting_prompt},
+                ],
+                temperature=0.7,  # Higher temperature for more natural language
+            )
+            formatted = FormattedAnswersSchema.model_validate(
+                parse_fuzzy_json(ai_response.choices[0].message.content or "")
+            ).root
+            if len(formatted) != len(pending):
+                raise ValueError(
+                    f"Expected {len(pending)} formatted responses, got {len(formatted)}"
+                )
+        except Exception as e:
+            logger.error("Failed to format responses naturally: %s", e, exc_info=True)
+            for i in pending:
+                texts[i] = _formatting_fallback(batch[i])
+            return texts
+
+        logger.info("Formatted %d responses naturally in one AI call", len(pending))
+        for i, text in zip(pending, formatted):
+            texts[i] = text.strip()
+        if cache is not None:
+            await asyncio.gather(
+                *(
+                    cache.set(
+                        cache_keys[i], texts[i].encode(), ttl=settings.format_cache_ttl
+                    )
+                    for i in pending
+                )
+            )
+        return texts
+
+    def _format_without_ai(self, response: FinancialAnswerSchema) -> str | None:
+        """
+        Return the final text for a response that needs no formatting call.
+
+        Returns:
+            The text to send, or None if the AI should format the response
+        """
+        if settings.always_reformat:
+            return None
+        if not self._has_tool_data(response):
+            # Nothing for the AI to add (clarifications, fallbacks, failed
+            # tools); skip the second round-trip and send the answer as it is
+            return response.answer
+        return self._try_template(response)
+
+    @property
+    def _format_cache(self) -> ResponseCache | None:
+        """The cache for formatted text, or None when there is nowhere to store it."""
+        if self.cache is None or not self.cache.enabled:
+            return None
+        return self.cache
+
+    @staticmethod
+    def _format_cache_key(response: FinancialAnswerSchema) -> str:
+        """
+        Key a formatted answer by everything that goes into its prompt.
+
+        Sorting keys makes the hash independent of the order tools returned
+        their fields in, so equal results always hit the same entry.
+        """
+        payload = orjson.dumps(
+            response.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS
+        )
+        digest = hashlib.sha256(payload).hexdigest()
+        return f"format:{settings.deepseek_model}:{digest}"
+
+    @staticmethod
+    def _has_tool_data(response: FinancialAnswerSchema) -> bool:
+        """
+        Check whether any tool call produced a result worth presenting.
+
+        The answer from `ask` is written before the tools run, so any real
+        figures only reach the user through the formatting step.
+        """
+        return any(
+            not (isinstance(tool_call.result, dict) and "error" in tool_call.result)
+            for tool_call in response.tool_calls
+        )
+
+    @staticmethod
+    def _try_template(response: FinancialAnswerSchema) -> str | None:
+        """
+        Render simple single-tool results without a second AI call.
+
+        Covers a spending summary and up to three payments to a recipient,
+        where a fixed sentence reads as well as a rewrite.
+
+        Returns:
+            The formatted text, or None if the AI should format the response
+        """
+        if len(response.tool_calls) != 1:
+            return None
 
-        # Execute the tool
-        result = await tool(**params)
+        tool_call = response.tool_calls[0]
+        result = tool_call.result
 
-        # Convert Decimal to float for JSON serialization
-        return self._serialize_result(result)
+        if tool_call.tool == "get_spending_summary" and isinstance(result, dict):
+            if "total" not in result or "count" not in result:
+                return None
+            verb = {"outgoing": "spent", "incoming": "received"}.get(
+                result.get("direction"), "moved"
+            )
+            period = result.get("period")
+            when = "overall" if period in (None, "All Time") else f"in {period}"
+            count = result["count"]
+            noun = "transaction" if count == 1 else "transactions"
+            return (
+                f"You {verb} {Decimal(result['total']):,.2f} KES across "
+                f"{count} {noun} {when}."
+            )
 
-    def _serialize_result(self, result: Any) -> Any:
+        if tool_call.tool == "get_payments_by_recipient" and isinstance(result, list):
+            if not result:
+                name = tool_call.params.get("name", "that recipient")
+                return f"I couldn't find any payments matching {name}."
+            if len(result) > 3:
+                return None
+            lines = []
+            for payment in result:
+                preposition = "from" if payment.get("direction") == "incoming" else "to"
+                paid = payment.get("date")
+                on = f" on {paid:%d %B %Y}" if hasattr(paid, "strftime") else ""
+                lines.append(
+                    f"- {Decimal(payment['amount']):,.2f} KES {preposition} "
+                    f"{payment['name']}{on}"
+                )
+            return "Here are the matching payments:\n" + "\n".join(lines)
+
+        return None
+
+    async def _execute_tool(self, tool_name: str, params: dict[str, Any]) -> Any:
         """
-        Convert result to JSON-serializable format.
+        Execute a tool by name with given parameters.
 
         Args:
-            result: Tool result
+            tool_name: Name of the tool to execute
+            params: Parameters to pass to the tool
 
         Returns:
-            JSON-serializable result
+            Tool result
+
+        Raises:
+            ValueError: If tool name is unknown
         """
-        from datetime import datetime
-        from decimal import Decimal
-
-        if isinstance(result, dict):
-            return {k: self._serialize_result(v) for k, v in result.items()}
-        elif isinstance(result, list):
-            return [self._serialize_result(item) for item in result]
-        elif isinstance(result, Decimal):
-            return float(result)
-        elif isinstance(result, datetime):
-            return result.isoformat()
-        else:
-            return result
+        if tool_name not in self.TOOL_NAMES:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        tool = getattr(self.financial_tools, tool_name)
+
+        # Decimals and datetimes are handled by orjson when the result is dumped
+        return await tool(**params)
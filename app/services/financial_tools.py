@@ -12,12 +12,15 @@ Design Philosophy: Following Anthropic's agent building principles
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Literal
 
-from fastapi import Depends
-
+from app.core.cache import ResponseCache, cached
+from app.core.settings import settings
 from app.repositories.payment_repository import PaymentRepository
 
 logger = logging.getLogger(__name__)
@@ -26,6 +29,19 @@ PeriodType = Literal["this_month", "last_month", "this_year", "last_year", "all_
 DirectionType = Literal["outgoing", "incoming", "all"]
 GranularityType = Literal["day", "week", "month"]
 
+_LIMIT_ERR_20 = "Limit must be between 1 and 20"
+_LIMIT_ERR_100 = "Limit must be between 1 and 100"
+_LIMIT_ERR_365 = "Limit must be between 1 and 365"
+
+# Date ranges resolved during the current request, keyed by period. Set to a
+# fresh dict per agent question so every tool it runs sees the same bounds.
+request_date_ranges: ContextVar[
+    dict[str, tuple[datetime | None, datetime | None]] | None
+] = ContextVar("request_date_ranges", default=None)
+
+# Subtracted from the start of the next period to get an inclusive end bound
+_LAST_INSTANT = timedelta(microseconds=1)
+
 
 def get_date_range(period: PeriodType) -> tuple[datetime | None, datetime | None]:
     """
@@ -53,63 +69,7 @@ def get_date_range(period: PeriodType) -> tuple[datetime | None, datetime | None
         >>> get_date_range("all_time")
         (None, None)
     """
-    now = datetime.now()
-
-    if period == "all_time":
-        return None, None
-
-    elif period == "this_month":
-        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        # Last day of current month
-        if now.month == 12:
-            end = now.replace(day=31, hour=23, minute=59, second=59, microsecond=999999)
-        else:
-            next_month = now.replace(month=now.month + 1, day=1)
-            end = (next_month - timedelta(days=1)).replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-        return start, end
-
-    elif period == "last_month":
-        # First day of current month
-        first_of_this_month = now.replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        # Last day of last month
-        end = (first_of_this_month - timedelta(days=1)).replace(
-            hour=23, minute=59, second=59, microsecond=999999
-        )
-        # First day of last month
-        start = end.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        return start, end
-
-    elif period == "this_year":
-        start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-        end = now.replace(
-            month=12, day=31, hour=23, minute=59, second=59, microsecond=999999
-        )
-        return start, end
-
-    elif period == "last_year":
-        start = now.replace(
-            year=now.year - 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        end = now.replace(
-            year=now.year - 1,
-            month=12,
-            day=31,
-            hour=23,
-            minute=59,
-            second=59,
-            microsecond=999999,
-        )
-        return start, end
-
-    else:
-        raise ValueError(
-            f"Unknown period: {period}. "
-            f"Valid options: this_month, last_month, this_year, last_year, all_time"
-        )
+    return _cached_date_range(period, _current_minute())
 
 
 def format_period_name(period: PeriodType) -> str:
@@ -129,21 +89,91 @@ def format_period_name(period: PeriodType) -> str:
         >>> format_period_name("all_time")
         "All Time"
     """
-    now = datetime.now()
-
-    if period == "all_time":
-        return "All Time"
-    elif period == "this_month":
-        return now.strftime("%B %Y")
-    elif period == "last_month":
-        last_month = now.replace(day=1) - timedelta(days=1)
-        return last_month.strftime("%B %Y")
-    elif period == "this_year":
-        return str(now.year)
-    elif period == "last_year":
-        return str(now.year - 1)
-    else:
+    return _cached_period_name(period, _current_minute())
+
+
+def _current_minute() -> int:
+    """Cache key that changes once per wall-clock minute."""
+    return int(time.time()) // 60
+
+
+# Results only change at period boundaries, so they are computed at most once
+# per minute; the minute is part of the key purely to expire old entries.
+@lru_cache(maxsize=16)
+def _cached_date_range(
+    period: PeriodType, minute: int
+) -> tuple[datetime | None, datetime | None]:
+    return _compute_date_range(period)
+
+
+@lru_cache(maxsize=16)
+def _cached_period_name(period: PeriodType, minute: int) -> str:
+    return _compute_period_name(period)
+
+
+def _this_month(year: int, month: int) -> tuple[datetime, datetime]:
+    end_year, end_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return datetime(year, month, 1), datetime(end_year, end_month, 1) - _LAST_INSTANT
+
+
+def _last_month(year: int, month: int) -> tuple[datetime, datetime]:
+    start_year, start_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    start = datetime(start_year, start_month, 1)
+    return start, datetime(year, month, 1) - _LAST_INSTANT
+
+
+def _this_year(year: int, month: int) -> tuple[datetime, datetime]:
+    return datetime(year, 1, 1), datetime(year + 1, 1, 1) - _LAST_INSTANT
+
+
+def _last_year(year: int, month: int) -> tuple[datetime, datetime]:
+    return datetime(year - 1, 1, 1), datetime(year, 1, 1) - _LAST_INSTANT
+
+
+def _all_time(year: int, month: int) -> tuple[None, None]:
+    return None, None
+
+
+_DATE_RANGE_BUILDERS = {
+    "this_month": _this_month,
+    "last_month": _last_month,
+    "this_year": _this_year,
+    "last_year": _last_year,
+    "all_time": _all_time,
+}
+
+
+def _last_month_name(today: date) -> str:
+    return (today.replace(day=1) - timedelta(days=1)).strftime("%B %Y")
+
+
+_PERIOD_NAME_BUILDERS = {
+    "this_month": lambda today: today.strftime("%B %Y"),
+    "last_month": _last_month_name,
+    "this_year": lambda today: str(today.year),
+    "last_year": lambda today: str(today.year - 1),
+    "all_time": lambda today: "All Time",
+}
+
+
+def _compute_date_range(
+    period: PeriodType,
+) -> tuple[datetime | None, datetime | None]:
+    builder = _DATE_RANGE_BUILDERS.get(period)
+    if builder is None:
+        raise ValueError(
+            f"Unknown period: {period}. "
+            f"Valid options: this_month, last_month, this_year, last_year, all_time"
+        )
+    today = date.today()
+    return builder(today.year, today.month)
+
+
+def _compute_period_name(period: PeriodType) -> str:
+    builder = _PERIOD_NAME_BUILDERS.get(period)
+    if builder is None:
         return period
+    return builder(date.today())
 
 
 class FinancialTools:
@@ -151,12 +181,29 @@ class FinancialTools:
     Financial analysis tools for the AI agent.
 
     Each method is a tool that the AI can call to retrieve specific
-    financial information from the end_user_payments table.
+    financial information from the end_user_payments table. Aggregate tools
+    are cached for `financial_cache_ttl` seconds when a cache is given.
     """
 
-    def __init__(self, payment_repository: PaymentRepository = Depends()):
+    def __init__(
+        self,
+        payment_repository: PaymentRepository,
+        cache: ResponseCache | None = None,
+    ):
         self.payment_repository = payment_repository
-
+        self.cache = cache
+
+    @staticmethod
+    def _date_range(period: PeriodType) -> tuple[datetime | None, datetime | None]:
+        """Resolve a period once per request when `request_date_ranges` is set."""
+        cache = request_date_ranges.get()
+        if cache is None:
+            return get_date_range(period)
+        if period not in cache:
+            cache[period] = get_date_range(period)
+        return cache[period]
+
+    @cached(prefix="fin", expire=settings.financial_cache_ttl)
     async def get_spending_summary(
         self,
         period: PeriodType = "this_month",
@@ -220,7 +267,7 @@ class FinancialTools:
             f"consumer_phone_number={consumer_phone_number}"
         )
 
-        start_date, end_date = get_date_range(period)
+        start_date, end_date = self._date_range(period)
 
         result = await self.payment_repository.get_total_by_period(
             start_date=start_date,
@@ -292,26 +339,16 @@ class FinancialTools:
             f"consumer_phone_number={consumer_phone_number}"
         )
 
-        if limit < 1 or limit > 100:
-            raise ValueError("Limit must be between 1 and 100")
+        if not 1 <= limit <= 100:
+            raise ValueError(_LIMIT_ERR_100)
 
-        payments = await self.payment_repository.get_payments_by_name_fuzzy(
+        return await self.payment_repository.get_payments_by_name_fuzzy(
             name=name,
             limit=limit,
             consumer_phone_number=consumer_phone_number,
         )
 
-        return [
-            {
-                "name": payment.name,
-                "amount": payment.amount,
-                "date": payment.paid_at or payment.created_at,
-                "direction": payment.direction,
-                "transaction_id": payment.transaction_id,
-            }
-            for payment in payments
-        ]
-
+    @cached(prefix="fin", expire=settings.financial_cache_ttl)
     async def get_top_recipients(
         self,
         direction: DirectionType = "outgoing",
@@ -369,10 +406,10 @@ class FinancialTools:
             f"period={period}, consumer_phone_number={consumer_phone_number}"
         )
 
-        if limit < 1 or limit > 20:
-            raise ValueError("Limit must be between 1 and 20")
+        if not 1 <= limit <= 20:
+            raise ValueError(_LIMIT_ERR_20)
 
-        start_date, end_date = get_date_range(period)
+        start_date, end_date = self._date_range(period)
 
         recipients = await self.payment_repository.get_top_recipients_aggregated(
             direction=direction,
@@ -384,6 +421,7 @@ class FinancialTools:
 
         return recipients
 
+    @cached(prefix="fin", expire=settings.financial_cache_ttl)
     async def get_spending_by_category(
         self,
         period: PeriodType = "this_month",
@@ -432,24 +470,86 @@ class FinancialTools:
             f"consumer_phone_number={consumer_phone_number}"
         )
 
-        start_date, end_date = get_date_range(period)
+        start_date, end_date = self._date_range(period)
+
+        # Percentages are computed by the repository query
+        return await self.payment_repository.get_spending_by_sender(
+            start_date=start_date,
+            end_date=end_date,
+            consumer_phone_number=consumer_phone_number,
+        )
+
+    @cached(prefix="fin", expire=settings.financial_cache_ttl)
+    async def get_financial_overview(
+        self,
+        period: PeriodType = "this_month",
+        limit: int = 5,
+        consumer_phone_number: str | None = None,
+    ) -> dict:
+        """
+        Get total spending, top recipients and the payment method breakdown
+        for one period in a single query.
+
+        Use this tool when one question needs all three for the same period,
+        instead of calling get_spending_summary, get_top_recipients and
+        get_spending_by_category separately.
+
+        Args:
+            period: Time period to analyze (default: "this_month")
+            limit: Number of top recipients to return (default: 5, max: 20)
+            consumer_phone_number: Optional phone number to filter by specific user
+
+        Returns:
+            Dictionary with:
+                - total: Total amount spent as Decimal
+                - count: Number of transactions as int
+                - period: Human-readable period description
+                - top_recipients: List of dicts with name, total, count, average
+                - by_sender: List of dicts with sender_id, total, count, percentage
+
+        Examples:
+            User: "Give me an overview of my spending this month"
+            >>> await get_financial_overview("this_month")
+            {
+                "total": Decimal("45000.00"),
+                "count": 23,
+                "period": "January 2026",
+                "top_recipients": [{"name": "Safaricom Ltd", ...}, ...],
+                "by_sender": [{"sender_id": "MPESA", "percentage": 66.7, ...}, ...]
+            }
+
+        Raises:
+            ValueError: If limit is invalid (< 1 or > 20)
+        """
+        logger.info(
+            "get_financial_overview called: period=%s, limit=%s, "
+            "consumer_phone_number=%s",
+            period,
+            limit,
+            consumer_phone_number,
+        )
+
+        if not 1 <= limit <= 20:
+            raise ValueError(_LIMIT_ERR_20)
+
+        start_date, end_date = self._date_range(period)
 
-        categories = await self.payment_repository.get_spending_by_sender(
+        summary = await self.payment_repository.get_financial_summary(
             start_date=start_date,
             end_date=end_date,
             consumer_phone_number=consumer_phone_number,
+            limit=limit,
         )
 
-        # Calculate percentages
-        total_spending = sum(cat["total"] for cat in categories)
-        for cat in categories:
-            if total_spending > 0:
-                cat["percentage"] = float((cat["total"] / total_spending) * 100)
-            else:
-                cat["percentage"] = 0.0
+        total = summary["total"]
+        for sender in summary["by_sender"]:
+            sender["percentage"] = (
+                float(sender["total"] / total * 100) if total else 0.0
+            )
 
-        return categories
+        return {**summary, "period": format_period_name(period)}
 
+    @cached(prefix="fin", expire=settings.financial_cache_ttl)
     async def get_payment_trends(
         self,
         granularity: GranularityType = "month",
@@ -501,7 +601,7 @@ class FinancialTools:
             [...]
 
         Raises:
-            ValueError: If limit is invalid (< 1 or > 365)
+            ValueError: If limit is invalid (< 1 or > 365) or granularity is unknown
 
         Note:
             Returns data in reverse chronological order (most recent first).
@@ -511,8 +611,8 @@ class FinancialTools:
             f"consumer_phone_number={consumer_phone_number}"
         )
 
-        if limit < 1 or limit > 365:
-            raise ValueError("Limit must be between 1 and 365")
+        if not 1 <= limit <= 365:
+            raise ValueError(_LIMIT_ERR_365)
 
         trends = await self.payment_repository.get_trend_data(
             granularity=granularity,
@@ -0,0 +1,226 @@
+"""
+JSON handling for LLM output.
+
+The agent's tool-selection reply is a single JSON object whose "tool_calls"
+array is emitted first. Scanning the stream as it arrives lets each tool call
+be dispatched as soon as its object closes, instead of waiting for the model
+to finish writing the answer text that follows. Once the reply is complete,
+`parse_fuzzy_json` tolerates the usual ways models bend the JSON format.
+"""
+
+import logging
+import re
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Contents of a ```json fence; an unterminated fence runs to the end
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def parse_fuzzy_json(text: str) -> Any:
+    """
+    Parse JSON from model output, repairing common defects.
+
+    Valid JSON is returned as is, even if its strings contain ```. Otherwise
+    accepts markdown code fences, prose before the first bracket, trailing
+    commas and truncated output (unclosed strings, objects and arrays are
+    closed in order).
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        orjson.JSONDecodeError: If the text cannot be parsed even after repair
+
+    Examples:
+        >>> parse_fuzzy_json('```json\\n{"a": [1, 2,],}\\n```')
+        {'a': [1, 2]}
+        >>> parse_fuzzy_json('{"a": {"b": "trunc')
+        {'a': {'b': 'trunc'}}
+    """
+    text = text.strip()
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError as e:
+        error = e
+
+    # Only a fence that opens before any JSON wraps the reply; one further in
+    # is part of a string value and must be left alone
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    match = _FENCE_RE.search(text)
+    if match and (not starts or match.start() < min(starts)):
+        text = match.group(1)
+        starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+
+    if starts:
+        text = text[min(starts) :]
+
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+
+    try:
+        return orjson.loads(_repair_json(text))
+    except orjson.JSONDecodeError:
+        raise error from None
+
+
+def _repair_json(text: str) -> str:
+    """Drop trailing commas and close anything left open, respecting strings."""
+    out: list[str] = []
+    stack: list[str] = []
+    in_string = False
+    escape = False
+
+    for char in text:
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if stack and _CLOSERS[stack[-1]] == char:
+                stack.pop()
+        out.append(char)
+
+    if in_string:
+        if escape:
+            out.pop()
+        out.append('"')
+
+    _drop_trailing_comma(out)
+    if out and out[-1] == ":":
+        out.append("null")
+
+    for opener in reversed(stack):
+        _drop_trailing_comma(out)
+        out.append(_CLOSERS[opener])
+
+    return "".join(out)
+
+
+def _drop_trailing_comma(out: list[str]) -> None:
+    i = len(out) - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i >= 0 and out[i] == ",":
+        del out[i:]
+
+
+class ToolCallStreamParser:
+    """
+    Extract completed objects from a top-level "tool_calls" array in a stream.
+
+    The scanner tracks string/escape state and a stack of open containers, so
+    braces inside string values are ignored. Each object is read with
+    `parse_fuzzy_json`, so small defects such as trailing commas are repaired;
+    anything still unreadable is skipped, and the caller should reconcile
+    against the full text once the stream ends.
+
+    Examples:
+        >>> parser = ToolCallStreamParser()
+        >>> parser.feed('{"tool_calls": [{"tool": "a", "par')
+        []
+        >>> parser.feed('ams": {}}, ')
+        [{'tool': 'a', 'params': {}}]
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string = ""
+        self._top_level_key: str | None = None
+        self._array_depth: int | None = None  # Stack size inside "tool_calls"
+        self._object_start: int | None = None
+
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of model output
+
+        Returns:
+            Tool call objects completed by this chunk, in order
+        """
+        self._text += chunk
+        completed = []
+
+        text = self._text
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start + 1 : i]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":" and len(self._stack) == 1:
+                self._top_level_key = self._last_string
+            elif char in "{[":
+                if (
+                    char == "["
+                    and len(self._stack) == 1
+                    and self._top_level_key == "tool_calls"
+                ):
+                    self._array_depth = len(self._stack) + 1
+                elif char == "{" and len(self._stack) == self._array_depth:
+                    self._object_start = i
+                self._stack.append(char)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if (
+                    char == "}"
+                    and self._object_start is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    completed.extend(self._load(text[self._object_start : i + 1]))
+                    self._object_start = None
+                elif char == "]" and len(self._stack) == 1:
+                    self._array_depth = None
+
+        self._pos = len(text)
+        return completed
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        return self._text
+
+    @staticmethod
+    def _load(fragment: str) -> list[dict[str, Any]]:
+        try:
+            value = parse_fuzzy_json(fragment)
+        except orjson.JSONDecodeError:
+            logger.warning("Skipping unparseable streamed tool call: %s", fragment)
+            return []
+        return [value] if isinstance(value, dict) else []
@@ -1,13 +1,118 @@
-from fastapi import Depends
-from tortoise.queryset import QuerySet
+import asyncio
+import base64
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from app.models.payment import EndUserPayment
 from app.repositories.payment_repository import PaymentRepository
 
+# Rows fetched per query when streaming the full listing
+STREAM_BATCH_SIZE = 500
+
+
+def encode_cursor(payment: dict) -> str:
+    """Encode the (paid_at, id) keyset position of a payment as an opaque cursor."""
+    paid_at = payment["paid_at"].isoformat() if payment["paid_at"] else None
+    raw = json.dumps([paid_at, payment["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        paid_at, payment_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if paid_at is not None:
+            paid_at = datetime.fromisoformat(paid_at)
+        if not isinstance(payment_id, int):
+            raise TypeError(payment_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    return paid_at, payment_id
+
 
 class PaymentService:
-    def __init__(self, payment_repository: PaymentRepository = Depends()):
+    def __init__(
+        self, payment_repository: PaymentRepository, db_slots: asyncio.Semaphore
+    ):
         self.payment_repository = payment_repository
+        # Caps the pool connections payment queries hold at once; taken only
+        # around database calls, never for cache hits or sending a response
+        self.db_slots = db_slots
+
+    async def iter_payments(self) -> AsyncIterator[dict]:
+        """
+        Stream every payment, newest first, as plain dicts.
+
+        Rows are fetched in keyset batches of STREAM_BATCH_SIZE, so memory
+        stays flat and a database slot is held only while a batch is read,
+        not while a slow client downloads it.
+        """
+        paid_at, payment_id = None, None
+        while True:
+            async with self.db_slots:
+                batch = await self.payment_repository.get_payments_before(
+                    paid_at=paid_at, payment_id=payment_id, limit=STREAM_BATCH_SIZE
+                )
+            for payment in batch:
+                yield payment
+            if len(batch) < STREAM_BATCH_SIZE:
+                return
+            paid_at, payment_id = batch[-1]["paid_at"], batch[-1]["id"]
+
+    async def get_payments_page(
+        self, limit: int, offset: int
+    ) -> tuple[list[dict], int]:
+        """
+        Get a page of payments as plain dicts along with the total count.
+
+        Args:
+            limit: Page size
+            offset: Number of rows to skip
+
+        Returns:
+            Tuple of (payments, total)
+        """
+        async with self.db_slots:
+            payments = await self.payment_repository.get_all_payments_dicts(
+                limit=limit, offset=offset
+            )
+            total = await self.payment_repository.get_all_payments().count()
+        return payments, total
+
+    async def get_payments_by_cursor(
+        self, cursor: str | None, limit: int
+    ) -> tuple[list[dict], str | None]:
+        """
+        Get a page of payments as plain dicts using keyset pagination.
+
+        Shares its keyset query with `iter_payments`, so every page is a
+        bounded index range scan regardless of depth.
+
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            limit: Page size
+
+        Returns:
+            Tuple of (payments, next_cursor). next_cursor is None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        paid_at, payment_id = decode_cursor(cursor) if cursor else (None, None)
+
+        # Fetch one extra row to find out whether another page exists
+        async with self.db_slots:
+            payments = await self.payment_repository.get_payments_before(
+                paid_at=paid_at, payment_id=payment_id, limit=limit + 1
+            )
+        if len(payments) <= limit:
+            return payments, None
 
-    def get_payments(self) -> QuerySet[EndUserPayment]:
-        return self.payment_repository.get_all_payments()
+        payments = payments[:limit]
+        return payments, encode_cursor(payments[-1])
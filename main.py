@@ -1,16 +1,23 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import httpx
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_pagination import add_pagination
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from redis.asyncio import Redis
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from tortoise.contrib.fastapi import RegisterTortoise
 
 from app.api.v1.ai import router as ai_router
 from app.api.v1.financial import router as financial_router
 from app.api.v1.payments import router as payments_router
+from app.core.cache import ResponseCache
 from app.core.database import TORTOISE_ORM
 from app.core.exception_handlers import (
     ai_service_exception_handler,
@@ -19,18 +26,68 @@ from app.core.exception_handlers import (
     validation_exception_handler,
 )
 from app.core.exceptions import AIServiceException
+from app.core.logging_config import start_queue_logging, stop_queue_logging
+from app.core.settings import settings
+from app.repositories.payment_repository import PaymentRepository
+from app.services.ai_service import AIService
+from app.services.financial_agent_service import FinancialAgentService
+from app.services.financial_tools import FinancialTools
+from app.services.payment_service import PaymentService
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    # Handlers run on a background thread; the event loop only enqueues records
+    log_listener = start_queue_logging(settings.log_level)
+    # Pool sizing lives in settings (db_pool_min_size/db_pool_max_size), with
+    # headroom so a slow query doesn't hold up concurrent requests
     async with RegisterTortoise(
         app=app,
         config=TORTOISE_ORM,
         # generate_schemas=True,
     ):
         # db connected
+        deepseek_client = AsyncOpenAI(
+            api_key=settings.deepseek_api_key,
+            base_url=settings.deepseek_api_base_url,
+            timeout=settings.llm_request_timeout,
+            max_retries=settings.llm_max_retries,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            ),
+        )
+        app.state.ai_service = AIService(deepseek_client)
+        # Stateless services are built once and shared across requests
+        redis_client = (
+            Redis.from_url(
+                settings.redis_url,
+                max_connections=20,
+                socket_connect_timeout=settings.redis_socket_timeout,
+                socket_timeout=settings.redis_socket_timeout,
+            )
+            if settings.redis_url
+            else None
+        )
+        app.state.response_cache = ResponseCache(
+            redis_client, ttl=settings.payments_cache_ttl
+        )
+        payment_repository = PaymentRepository()
+        app.state.financial_agent_service = FinancialAgentService(
+            FinancialTools(payment_repository, cache=app.state.response_cache),
+            deepseek_client,
+            cache=app.state.response_cache,
+        )
+        app.state.payment_service = PaymentService(
+            payment_repository,
+            db_slots=asyncio.Semaphore(settings.payments_max_db_connections),
+        )
         yield
         # app teardown
+        await app.state.ai_service.aclose()
+        await deepseek_client.close()
+        if redis_client is not None:
+            await redis_client.aclose()
+    stop_queue_logging(log_listener)
 
 
 app = FastAPI(
@@ -44,6 +101,7 @@ app = FastAPI(
         "docExpansion": "none",
     },
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 add_pagination(app)
@@ -60,6 +118,9 @@ app.include_router(financial_router)
 app.include_router(payments_router)
 
 # Middleware
+# Compress large payment lists; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS
 # Allow all origins for development purposes
 # In production, specify the allowed origins to restrict access to your API
@@ -1,17 +1,19 @@
 """
 Test script for AI-powered natural language formatter
 
-This script demonstrates the format_response_naturally method which uses
-AI to convert structured responses into conversational English.
+This script demonstrates the format_responses_naturally method which uses
+AI to convert structured responses into conversational English, formatting
+several responses in one call.
 
 Run with: uv run python test_ai_formatter.py
 """
 
 import asyncio
 
-from tortoise import Tortoise
+from openai import AsyncOpenAI
 
-from app.core.database import TORTOISE_ORM
+from app.core.database import db_lifecycle
+from app.core.settings import settings
 from app.repositories.payment_repository import PaymentRepository
 from app.schemas.financial_schema import FinancialAnswerSchema, ToolCall
 from app.services.financial_agent_service import FinancialAgentService
@@ -21,13 +23,14 @@ from app.services.financial_tools import FinancialTools
 async def test_ai_formatter():
     """Test the AI-powered natural language formatter."""
 
-    # Initialize database
-    await Tortoise.init(config=TORTOISE_ORM)
-
     # Initialize services
     repo = PaymentRepository()
     tools = FinancialTools(repo)
-    agent = FinancialAgentService(tools)
+    client = AsyncOpenAI(
+        api_key=settings.deepseek_api_key,
+        base_url=settings.deepseek_api_base_url,
+    )
+    agent = FinancialAgentService(tools, client)
 
     print("\n" + "=" * 70)
     print("TESTING AI-POWERED NATURAL LANGUAGE FORMATTER")
@@ -35,13 +38,18 @@ async def test_ai_formatter():
     print("\nThis formatter uses AI to convert structured JSON responses")
     print("into natural, conversational English.\n")
 
+    # The three queries are independent, so run them concurrently
+    spending_result, top_recipients, trends = await asyncio.gather(
+        tools.get_spending_summary("this_month", "outgoing"),
+        tools.get_top_recipients("outgoing", limit=5),
+        tools.get_payment_trends("month", limit=6),
+    )
+
     # Test 1: Spending Summary
     print("\n" + "=" * 70)
     print("TEST 1: Spending Summary")
     print("=" * 70)
 
-    spending_result = await tools.get_spending_summary("this_month", "outgoing")
-
     response1 = FinancialAnswerSchema(
         answer=f"You spent {spending_result['total']:,.2f} KES this month.",
         tool_calls=[
@@ -59,18 +67,11 @@ async def test_ai_formatter():
     print(f"Tool: {response1.tool_calls[0].tool}")
     print(f"Result: {response1.tool_calls[0].result}")
 
-    print("\nAI-FORMATTED NATURAL LANGUAGE:")
-    print("-" * 70)
-    natural_text = await agent.format_response_naturally(response1)
-    print(natural_text)
-
     # Test 2: Top Recipients
     print("\n\n" + "=" * 70)
     print("TEST 2: Top Recipients")
     print("=" * 70)
 
-    top_recipients = await tools.get_top_recipients("outgoing", limit=5)
-
     response2 = FinancialAnswerSchema(
         answer="Here are your top 5 expenses.",
         tool_calls=[
@@ -92,18 +93,11 @@ async def test_ai_formatter():
     print(f"Tool: {response2.tool_calls[0].tool}")
     print(f"Result count: {len(top_recipients)} recipients")
 
-    print("\nAI-FORMATTED NATURAL LANGUAGE:")
-    print("-" * 70)
-    natural_text = await agent.format_response_naturally(response2)
-    print(natural_text)
-
     # Test 3: Payment Trends
     print("\n\n" + "=" * 70)
     print("TEST 3: Payment Trends")
     print("=" * 70)
 
-    trends = await tools.get_payment_trends("month", limit=6)
-
     response3 = FinancialAnswerSchema(
         answer="Here are your monthly spending trends.",
         tool_calls=[
@@ -121,10 +115,16 @@ async def test_ai_formatter():
     print(f"Tool: {response3.tool_calls[0].tool}")
     print(f"Result count: {len(trends)} periods")
 
-    print("\nAI-FORMATTED NATURAL LANGUAGE:")
-    print("-" * 70)
-    natural_text = await agent.format_response_naturally(response3)
-    print(natural_text)
+    # All three responses are formatted together in a single AI call
+    formatted = await agent.format_responses_naturally(
+        [response1, response2, response3]
+    )
+    titles = ["Spending Summary", "Top Recipients", "Payment Trends"]
+    for i, (title, text) in enumerate(zip(titles, formatted), 1):
+        print("\n\n" + "=" * 70)
+        print(f"TEST {i}: AI-FORMATTED NATURAL LANGUAGE ({title})")
+        print("=" * 70)
+        print(text)
 
     print("\n\n" + "=" * 70)
     print("ALL TESTS COMPLETE")
@@ -132,9 +132,14 @@ async def test_ai_formatter():
     print("\nThe AI successfully converted structured JSON data into")
     print("natural, conversational English!")
 
-    # Close database connection
-    await Tortoise.close_connections()
+    # Close AI connections
+    await client.close()
+
+
+async def main():
+    async with db_lifecycle():
+        await test_ai_formatter()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_ai_formatter())
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Tests for AIService's micro-batching lifecycle with a fake client
+
+No network is used, but settings are still loaded from .env.
+
+Run with: uv run python test_ai_service.py (or pytest)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.core.exceptions import AIServiceUnavailableException
+from app.services.ai_service import AIService
+
+
+def fake_client(delay: float = 0.0) -> SimpleNamespace:
+    async def create(model, messages):
+        await asyncio.sleep(delay)
+        message = SimpleNamespace(content=f"echo: {messages[-1]['content']}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+
+def test_chat_starts_batcher_on_first_use():
+    async def run():
+        service = AIService(fake_client())
+        replies = await asyncio.wait_for(
+            asyncio.gather(service.chat("a"), service.chat("b")), timeout=1
+        )
+        await service.aclose()
+        return replies
+
+    assert asyncio.run(run()) == [{"message": "echo: a"}, {"message": "echo: b"}]
+
+
+def test_chat_without_batcher_fails_fast():
+    """Once the batcher is gone, chat() raises instead of waiting forever."""
+
+    async def run():
+        service = AIService(fake_client())
+        await service.aclose()
+        try:
+            await asyncio.wait_for(service.chat("hello"), timeout=1)
+        except AIServiceUnavailableException:
+            return True
+        return False
+
+    assert asyncio.run(run())
+
+
+def test_aclose_fails_in_flight_batches():
+    async def run():
+        service = AIService(fake_client(delay=10))
+        pending = asyncio.create_task(service.chat("slow"))
+        await asyncio.sleep(0.05)  # Let the batch be dispatched
+        await asyncio.wait_for(service.aclose(), timeout=1)
+        try:
+            await asyncio.wait_for(pending, timeout=1)
+        except AIServiceUnavailableException:
+            return True
+        return False
+
+    assert asyncio.run(run())
+
+
+def test_aclose_fails_requests_in_batching_window():
+    """Requests collected but not yet dispatched are failed, not stranded."""
+
+    async def run():
+        service = AIService(fake_client())
+        pending = asyncio.create_task(service.chat("early"))
+        await asyncio.sleep(0.002)  # Inside the WINDOW_MS collection window
+        await asyncio.wait_for(service.aclose(), timeout=1)
+        try:
+            await asyncio.wait_for(pending, timeout=1)
+        except AIServiceUnavailableException:
+            return True
+        return False
+
+    assert asyncio.run(run())
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
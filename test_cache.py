@@ -0,0 +1,170 @@
+"""
+Tests for ResponseCache and the @cached decorator with a fake Redis client
+
+No Redis is used, but settings are still loaded from .env.
+
+Run with: uv run python test_cache.py (or pytest)
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi import Request
+
+from app.core.cache import ResponseCache, cached, etag_json_response
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls ResponseCache makes."""
+
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+class Tools:
+    def __init__(self, cache: ResponseCache | None):
+        self.cache = cache
+        self.calls = 0
+
+    @cached(prefix="fin", expire=60)
+    async def summary(self, period: str = "this_month") -> dict:
+        self.calls += 1
+        return {
+            "total": Decimal("45000.50"),
+            "start_date": datetime(2026, 1, 1),
+            "period": period,
+        }
+
+
+def test_cached_round_trips_decimal_and_datetime():
+    tools = Tools(ResponseCache(FakeRedis()))
+
+    async def run():
+        first = await tools.summary("this_month")
+        second = await tools.summary(period="this_month")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert tools.calls == 1  # Positional and keyword calls share an entry
+    assert second == first
+    assert isinstance(second["total"], Decimal)
+    assert isinstance(second["start_date"], datetime)
+
+
+def test_cached_without_client_skips_key_building():
+    cache = ResponseCache(None)
+    tools = Tools(cache)
+
+    async def fail(key):
+        raise AssertionError("a disabled cache must not be read")
+
+    cache.get = fail
+
+    asyncio.run(tools.summary())
+    asyncio.run(tools.summary())
+
+    assert tools.calls == 2
+
+
+def counting_render(delay: float = 0.01):
+    """A render callback that records how often it runs."""
+    calls = []
+
+    async def render() -> bytes:
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return b'{"items": []}'
+
+    return render, calls
+
+
+def test_get_or_render_collapses_concurrent_misses():
+    redis = FakeRedis()
+    cache = ResponseCache(redis)
+    render, calls = counting_render()
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_render("payments:k", render) for _ in range(5))
+        )
+
+    bodies = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert bodies == [b'{"items": []}'] * 5
+    assert redis.store["payments:k"] == b'{"items": []}'
+
+
+def test_get_or_render_follower_survives_cancelled_leader():
+    """A follower renders itself instead of hanging when the leader is cancelled."""
+    cache = ResponseCache(FakeRedis())
+    render, calls = counting_render(delay=0.05)
+
+    async def run():
+        leader = asyncio.create_task(cache.get_or_render("payments:k", render))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(cache.get_or_render("payments:k", render))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        body = await asyncio.wait_for(follower, timeout=1)
+        return leader.cancelled(), body
+
+    leader_cancelled, body = asyncio.run(run())
+
+    assert leader_cancelled
+    assert body == b'{"items": []}'
+    assert len(calls) == 2
+    assert cache._inflight == {}
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = (
+        [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    )
+    return Request(
+        {"type": "http", "method": "GET", "path": "/payments", "headers": headers}
+    )
+
+
+BODY = b'{"items": [], "total": 0}'
+
+
+def test_etag_response_sends_body_and_tag():
+    response = etag_json_response(make_request(), BODY)
+
+    assert response.status_code == 200
+    assert response.body == BODY
+    assert response.headers["etag"].startswith('W/"')
+
+
+def test_etag_match_returns_304_without_body():
+    etag = etag_json_response(make_request(), BODY).headers["etag"]
+    strong = etag.removeprefix("W/")
+
+    for header in (etag, strong, f'"other", {etag}', "*"):
+        response = etag_json_response(make_request(header), BODY)
+        assert response.status_code == 304, header
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+
+def test_etag_mismatch_returns_body():
+    response = etag_json_response(make_request('W/"stale"'), BODY)
+
+    assert response.status_code == 200
+    assert response.body == BODY
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,89 @@
+"""
+Tests for FinancialAgentService.ask with a fake model and fake tools
+
+No database or network is used, but settings are still loaded from .env.
+
+Run with: uv run python test_financial_agent.py (or pytest)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.services.financial_agent_service import FinancialAgentService
+from test_json_stream import MIXED_REPLY
+
+
+class FakeStream:
+    """Replays a reply as streamed chat completion chunks."""
+
+    def __init__(self, text: str, chunk_size: int = 7):
+        self._chunks = [
+            text[i : i + chunk_size] for i in range(0, len(text), chunk_size)
+        ]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        delta = SimpleNamespace(content=self._chunks.pop(0))
+        return SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=delta)])
+
+
+def fake_client(reply: str) -> SimpleNamespace:
+    async def create(**kwargs):
+        return FakeStream(reply)
+
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+
+class FakeTools:
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+
+    async def get_spending_summary(self, **params):
+        self.calls.append(("get_spending_summary", params))
+        return {"total": 0, "count": 0}
+
+    async def get_top_recipients(self, **params):
+        self.calls.append(("get_top_recipients", params))
+        return []
+
+
+def test_ask_runs_every_call_when_one_is_defective():
+    tools = FakeTools()
+    agent = FinancialAgentService(tools, fake_client(MIXED_REPLY))
+
+    response = asyncio.run(agent.ask("What did I spend?"))
+
+    assert sorted(tools.calls) == [
+        ("get_spending_summary", {}),
+        ("get_top_recipients", {"limit": 3}),
+    ]
+    assert [tool_call.tool for tool_call in response.tool_calls] == [
+        "get_spending_summary",
+        "get_top_recipients",
+    ]
+
+
+def test_ask_does_not_repeat_streamed_calls():
+    tools = FakeTools()
+    reply = (
+        '{"tool_calls": [{"tool": "get_spending_summary", "params": {}}], '
+        '"answer": "ok", "confidence": "high"}'
+    )
+    agent = FinancialAgentService(tools, fake_client(reply))
+
+    asyncio.run(agent.ask("What did I spend?"))
+
+    assert tools.calls == [("get_spending_summary", {})]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
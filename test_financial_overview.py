@@ -0,0 +1,85 @@
+"""
+Tests for the GROUPING SETS financial overview with fake database rows
+
+No database is used, but settings are still loaded from .env.
+
+Run with: uv run python test_financial_overview.py (or pytest)
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import app.repositories.payment_repository as payment_repository_module
+from app.repositories.payment_repository import PaymentRepository
+from app.services.financial_tools import FinancialTools
+
+# Rows as returned by the GROUPING SETS query, ordered by total
+GROUPED_ROWS = [
+    {"grouping_set": 3, "name": None, "sender_id": None, "total": Decimal("300.00"),
+     "count": 6, "average": Decimal("50.00")},
+    {"grouping_set": 2, "name": None, "sender_id": "MPESA", "total": Decimal("200.00"),
+     "count": 4, "average": Decimal("50.00")},
+    {"grouping_set": 1, "name": "Safaricom", "sender_id": None,
+     "total": Decimal("150.00"), "count": 2, "average": Decimal("75.00")},
+    {"grouping_set": 2, "name": None, "sender_id": "AIRTELMONEY",
+     "total": Decimal("100.00"), "count": 2, "average": Decimal("50.00")},
+    {"grouping_set": 1, "name": "KPLC", "sender_id": None, "total": Decimal("100.00"),
+     "count": 3, "average": Decimal("33.33")},
+    {"grouping_set": 1, "name": None, "sender_id": None, "total": Decimal("50.00"),
+     "count": 1, "average": Decimal("50.00")},
+]  # fmt: skip
+
+
+def fake_connections(rows: list[dict]):
+    """Patch the repository's Tortoise connections to return `rows`."""
+
+    async def execute_query_dict(sql, params):
+        return [dict(row) for row in rows]
+
+    conn = SimpleNamespace(execute_query_dict=execute_query_dict)
+    return patch.object(
+        payment_repository_module,
+        "connections",
+        SimpleNamespace(get=lambda name: conn),
+    )
+
+
+def test_financial_summary_splits_grouping_sets():
+    with fake_connections(GROUPED_ROWS):
+        summary = asyncio.run(
+            PaymentRepository().get_financial_summary(None, None, limit=1)
+        )
+
+    assert summary["total"] == Decimal("300.00")
+    assert summary["count"] == 6
+    assert [r["name"] for r in summary["top_recipients"]] == ["Safaricom"]
+    assert [s["sender_id"] for s in summary["by_sender"]] == ["MPESA", "AIRTELMONEY"]
+
+
+def test_financial_overview_adds_period_and_percentages():
+    tools = FinancialTools(PaymentRepository())
+    with fake_connections(GROUPED_ROWS):
+        overview = asyncio.run(tools.get_financial_overview("all_time"))
+
+    assert overview["period"] == "All Time"
+    assert [r["name"] for r in overview["top_recipients"]] == ["Safaricom", "KPLC"]
+    assert [round(s["percentage"], 1) for s in overview["by_sender"]] == [66.7, 33.3]
+
+
+def test_financial_overview_empty_period():
+    tools = FinancialTools(PaymentRepository())
+    with fake_connections([]):
+        overview = asyncio.run(tools.get_financial_overview("this_month"))
+
+    assert overview["total"] == Decimal("0.00")
+    assert overview["top_recipients"] == []
+    assert overview["by_sender"] == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
@@ -7,9 +7,7 @@ Run with: uv run python test_financial_tools.py
 
 import asyncio
 
-from tortoise import Tortoise
-
-from app.core.database import TORTOISE_ORM
+from app.core.database import db_lifecycle
 from app.repositories.payment_repository import PaymentRepository
 from app.services.financial_tools import FinancialTools
 
@@ -17,9 +15,6 @@ from app.services.financial_tools import FinancialTools
 async def test_tools():
     """Test all financial tools with sample queries."""
 
-    # Initialize database
-    await Tortoise.init(config=TORTOISE_ORM)
-
     # Initialize tools
     repo = PaymentRepository()
     tools = FinancialTools(repo)
@@ -98,9 +93,11 @@ async def test_tools():
     print("TEST COMPLETE")
     print("=" * 60)
 
-    # Close database connection
-    await Tortoise.close_connections()
+
+async def main():
+    async with db_lifecycle():
+        await test_tools()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_tools())
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""
+Tests for the LLM JSON helpers in app/services/json_stream.py
+
+These need no database or API key.
+
+Run with: uv run python test_json_stream.py (or pytest)
+"""
+
+from app.services.json_stream import ToolCallStreamParser, parse_fuzzy_json
+
+# One well-formed call followed by one with a trailing comma
+MIXED_REPLY = (
+    '{"tool_calls": [{"tool": "get_spending_summary", "params": {}}, '
+    '{"tool": "get_top_recipients", "params": {"limit": 3,}}], '
+    '"answer": "Here you go", "confidence": "high"}'
+)
+
+
+def test_valid_json_with_backticks_in_strings():
+    """Backticks inside string values must not be read as a code fence."""
+    text = '{"answer": "use ```code``` here", "tool_calls": []}'
+    assert parse_fuzzy_json(text) == {"answer": "use ```code``` here", "tool_calls": []}
+
+
+def test_batched_array_with_markdown_fence_in_item():
+    text = '["Run this:\\n```sql\\nSELECT 1\\n```", "Second"]'
+    assert parse_fuzzy_json(text) == ["Run this:\n```sql\nSELECT 1\n```", "Second"]
+
+
+def test_fenced_reply():
+    text = '```json\n{"a": [1, 2,],}\n```'
+    assert parse_fuzzy_json(text) == {"a": [1, 2]}
+
+
+def test_prose_before_fence():
+    text = 'Here you go:\n```json\n{"a": 1}\n```'
+    assert parse_fuzzy_json(text) == {"a": 1}
+
+
+def test_truncated_reply():
+    assert parse_fuzzy_json('{"a": {"b": "trunc') == {"a": {"b": "trunc"}}
+
+
+def test_stream_parser_repairs_defective_call():
+    """A call with a small defect is still emitted after a clean one."""
+    parser = ToolCallStreamParser()
+    calls = []
+    for i in range(0, len(MIXED_REPLY), 7):
+        calls.extend(parser.feed(MIXED_REPLY[i : i + 7]))
+
+    assert calls == [
+        {"tool": "get_spending_summary", "params": {}},
+        {"tool": "get_top_recipients", "params": {"limit": 3}},
+    ]
+    assert calls == parse_fuzzy_json(MIXED_REPLY)["tool_calls"]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"{name}: ok")
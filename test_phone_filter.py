@@ -7,9 +7,7 @@ Run with: uv run python test_phone_filter.py
 
 import asyncio
 
-from tortoise import Tortoise
-
-from app.core.database import TORTOISE_ORM
+from app.core.database import db_lifecycle
 from app.repositories.payment_repository import PaymentRepository
 from app.services.financial_tools import FinancialTools
 
@@ -17,9 +15,6 @@ from app.services.financial_tools import FinancialTools
 async def test_phone_filter():
     """Test financial tools with phone number filtering."""
 
-    # Initialize database
-    await Tortoise.init(config=TORTOISE_ORM)
-
     # Initialize tools
     repo = PaymentRepository()
     tools = FinancialTools(repo)
@@ -34,7 +29,6 @@ async def test_phone_filter():
     sample_payment = await EndUserPayment.first()
     if not sample_payment:
         print("No payments found in database!")
-        await Tortoise.close_connections()
         return
 
     test_phone = sample_payment.consumer_phone_number
@@ -74,10 +68,12 @@ async def test_phone_filter():
     print("\n3. Comparison: With filter vs Without filter")
     print("-" * 60)
     try:
-        with_filter = await tools.get_spending_summary(
-            "this_month", "outgoing", consumer_phone_number=test_phone
+        with_filter, without_filter = await asyncio.gather(
+            tools.get_spending_summary(
+                "this_month", "outgoing", consumer_phone_number=test_phone
+            ),
+            tools.get_spending_summary("this_month", "outgoing"),
         )
-        without_filter = await tools.get_spending_summary("this_month", "outgoing")
 
         print("✓ This month's spending:")
         print(
@@ -93,9 +89,11 @@ async def test_phone_filter():
     print("TEST COMPLETE")
     print("=" * 60)
 
-    # Close database connection
-    await Tortoise.close_connections()
+
+async def main():
+    async with db_lifecycle():
+        await test_phone_filter()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_phone_filter())
+    asyncio.run(main())
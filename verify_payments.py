@@ -1,13 +1,11 @@
 import asyncio
 
-from tortoise import Tortoise
+from tortoise import connections
 
-from app.core.database import TORTOISE_ORM
-from app.models.payment import EndUserPayment
+from app.core.database import db_lifecycle
 
 
 async def verify_payments_api():
-    await Tortoise.init(config=TORTOISE_ORM)
     # await Tortoise.generate_schemas()  # Skipping schema generation due to permissions
 
     # Insert dummy data - Skipping due to permission issues
@@ -43,12 +41,18 @@ async def verify_payments_api():
     # but we can verify the repository/service logic or just print that data is ready
     # and then manually curl.
 
-    # For now, let's just query via ORM to confirm insertion
-    count = await EndUserPayment.all().count()
+    # For now, just count the rows to confirm insertion
+    result = await connections.get("default").execute_query_dict(
+        "SELECT COUNT(*) as count FROM end_user_payments"
+    )
+    count = result[0]["count"]
     print(f"Total payments in DB: {count}")
 
-    await Tortoise.close_connections()
+
+async def main():
+    async with db_lifecycle():
+        await verify_payments_api()
 
 
 if __name__ == "__main__":
-    asyncio.run(verify_payments_api())
+    asyncio.run(main())